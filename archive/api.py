@@ -4,44 +4,89 @@ REST and WebSocket API for GTMForge pipeline execution.
 """
 
 import asyncio
-import json
-from typing import Dict, Any, Optional
+import importlib.util
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, Any, Optional, Set, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_serializer
+import structlog
 import uvicorn
 
-from app.core.task_state import task_state, generate_task_id
+from app.core.task_state import _TERMINAL_STATUSES, task_state, generate_task_id, format_timestamp
 from app.core.orchestrator import GTMForgeOrchestrator
-from app.utils.logger import setup_task_logging, cleanup_task_logs
+from app.utils.logger import setup_task_logging, close_task_logging, cleanup_task_logs
+from app.utils.serialization import ORJSON_AVAILABLE, dumps
+
+logger = structlog.get_logger(__name__)
+
+# WebSocket handlers are woken by published frames; this is only a keepalive interval
+_WS_KEEPALIVE_SECONDS = 30.0
+_WS_QUEUE_MAXSIZE = 64
+# Frames published within this window are sent as one WebSocket message
+_WS_COALESCE_SECONDS = 0.02
+
+# Upper bound on concurrently running pipelines (protects RAM and downstream API quotas)
+_MAX_PIPELINES = int(os.getenv("MAX_PIPELINES", "8"))
+_PIPELINE_SEMAPHORE = asyncio.Semaphore(_MAX_PIPELINES)
+
+
+@lru_cache(maxsize=8)
+def _iso_for_tick(tick: int) -> str:
+    """ISO-8601 timestamp for a 10ms wall-clock tick (cached per tick)."""
+    return datetime.fromtimestamp(tick / 100).isoformat()
+
+
+def _frame_timestamp() -> str:
+    """Timestamp for WebSocket frames; frames in the same 10ms share one string."""
+    return _iso_for_tick(time.time_ns() // 10_000_000)
 
 
 # Pydantic models for API
 class GenerateIdeaRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+    
     idea: str = Field(..., description="Business idea to generate assets for")
     industry: str = Field(..., description="Industry context for the idea")
 
 
 class GenerateIdeaResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     task_id: str = Field(..., description="Unique task identifier")
     status: str = Field(..., description="Initial task status")
     message: str = Field(..., description="Status message")
 
 
 class TaskStatusResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     task_id: str = Field(..., description="Task identifier")
     status: str = Field(..., description="Current task status")
     progress: float = Field(..., description="Progress percentage (0-100)")
     current_stage: str = Field(..., description="Current pipeline stage")
-    created_at: str = Field(..., description="Task creation timestamp")
-    updated_at: str = Field(..., description="Last update timestamp")
+    # Epoch ns from the task store (ISO strings from older stores pass through)
+    created_at: Union[int, str] = Field(..., description="Task creation timestamp")
+    updated_at: Union[int, str] = Field(..., description="Last update timestamp")
+    
+    @field_serializer("created_at", "updated_at")
+    def _serialize_timestamp(self, value: Union[int, str]) -> str:
+        # Rendered as ISO-8601 only on the way out
+        return format_timestamp(value)
 
 
 class TaskResultsResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     task_id: str = Field(..., description="Task identifier")
     status: str = Field(..., description="Final task status")
     manifest: Optional[Dict[str, Any]] = Field(None, description="Published manifest")
@@ -54,7 +99,9 @@ class TaskResultsResponse(BaseModel):
 app = FastAPI(
     title="GTMForge API",
     description="AI-powered pitch deck generation with Imagen, Veo, and Canva",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson renders large result payloads several times faster than stdlib json
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # Add CORS middleware
@@ -66,30 +113,47 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON bodies (e.g. /results with the full pipeline state)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files for serving local assets
-from app.utils.config import OUTPUT_DIR
+from app.utils.config import OUTPUT_DIR, ensure_directories
+ensure_directories()
 app.mount("/assets", StaticFiles(directory=str(OUTPUT_DIR / "assets")), name="assets")
 
 # WebSocket connection manager
 class ConnectionManager:
+    """Fans task progress frames out to per-connection queues (pub/sub)."""
+    
+    __slots__ = ("subscribers",)
+    
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-
-    async def connect(self, websocket: WebSocket, task_id: str):
-        await websocket.accept()
-        self.active_connections[task_id] = websocket
-
-    def disconnect(self, task_id: str):
-        if task_id in self.active_connections:
-            del self.active_connections[task_id]
+        # Sets give O(1) unsubscribe; Queue hashes by identity
+        self.subscribers: Dict[str, Set[asyncio.Queue]] = {}
+    
+    def subscribe(self, task_id: str) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=_WS_QUEUE_MAXSIZE)
+        self.subscribers.setdefault(task_id, set()).add(queue)
+        return queue
+    
+    def unsubscribe(self, task_id: str, queue: asyncio.Queue):
+        queues = self.subscribers.get(task_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self.subscribers[task_id]
+    
+    def send_to_task(self, task_id: str, message: Dict[str, Any]):
+        queues = self.subscribers.get(task_id)
+        if not queues:
+            return
+        # Snapshot so a subscriber leaving mid-broadcast can't change the set under us
+        for queue in tuple(queues):
+            if queue.full():
+                # Slow consumer: drop its oldest frame rather than block the pipeline
+                queue.get_nowait()
+            queue.put_nowait(message)
 
-    async def send_to_task(self, task_id: str, message: Dict[str, Any]):
-        if task_id in self.active_connections:
-            try:
-                await self.active_connections[task_id].send_text(json.dumps(message))
-            except:
-                # Connection closed, remove it
-                self.disconnect(task_id)
 
 manager = ConnectionManager()
 
@@ -122,6 +186,57 @@ async def generate_idea(request: GenerateIdeaRequest):
     )
 
 
+# Serialized /status and /results bodies, keyed by task and valid while its updated_at
+# is unchanged, so polling clients re-encode only after a state transition. Entries
+# are per-process; they are only as fresh as the updated_at that task_state.get_task
+# returns, which is revalidated against the SQLite store on every read (and is the
+# in-memory value when persistence is disabled, which is single-process only).
+_STATUS_CACHE: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+_STATUS_CACHE_SIZE = 10_000
+_RESULTS_CACHE: "OrderedDict[str, Tuple[int, Tuple[bytes, ...]]]" = OrderedDict()
+_RESULTS_CACHE_SIZE = 256
+
+# Prebuilt serializers: pydantic-core writes JSON bytes directly, skipping FastAPI's
+# response_model validation + jsonable_encoder pass (a returned Response bypasses it)
+_STATUS_ADAPTER = TypeAdapter(TaskStatusResponse)
+
+
+def _cached_json(
+    cache: "OrderedDict[str, Tuple[int, bytes]]",
+    maxsize: int,
+    task: Dict[str, Any],
+    adapter: TypeAdapter,
+    build: Callable[[], BaseModel]
+) -> Response:
+    """
+    Return a task's JSON response body, encoding it only when the task changed.
+    
+    Args:
+        cache: LRU of task_id -> (updated_at, body)
+        maxsize: Maximum number of cached tasks
+        task: Task data from the state manager
+        adapter: Serializer for the response model
+        build: Builds the response model on a cache miss
+        
+    Returns:
+        JSON response with the cached body
+    """
+    task_id = task["task_id"]
+    version = task["updated_at"]
+    
+    entry = cache.get(task_id)
+    if entry is not None and entry[0] == version:
+        cache.move_to_end(task_id)
+        body = entry[1]
+    else:
+        body = adapter.dump_json(build())
+        cache[task_id] = (version, body)
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+    
+    return Response(content=body, media_type="application/json")
+
+
 @app.get("/status/{task_id}", response_model=TaskStatusResponse)
 async def get_task_status(task_id: str):
     """
@@ -131,14 +246,14 @@ async def get_task_status(task_id: str):
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    return TaskStatusResponse(
+    return _cached_json(_STATUS_CACHE, _STATUS_CACHE_SIZE, task, _STATUS_ADAPTER, lambda: TaskStatusResponse(
         task_id=task_id,
         status=task["status"],
         progress=task["progress"],
         current_stage=task["current_stage"],
         created_at=task["created_at"],
         updated_at=task["updated_at"]
-    )
+    ))
 
 
 @app.get("/results/{task_id}", response_model=TaskResultsResponse)
@@ -150,23 +265,77 @@ async def get_task_results(task_id: str):
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    if task["status"] not in ["completed", "failed"]:
+    if task["status"] not in _TERMINAL_STATUSES:
         raise HTTPException(status_code=400, detail="Task not completed yet")
     
-    response = TaskResultsResponse(
-        task_id=task_id,
-        status=task["status"],
-        execution_time_seconds=task.get("execution_time_seconds")
-    )
+    # Terminal results are effectively immutable: encoded once, then replayed
+    entry = _RESULTS_CACHE.get(task_id)
+    if entry is not None and entry[0] == task["updated_at"]:
+        _RESULTS_CACHE.move_to_end(task_id)
+        return StreamingResponse(iter(entry[1]), media_type="application/json")
+    
+    return StreamingResponse(_encode_results(task), media_type="application/json")
+
+
+async def _encode_results(task: Dict[str, Any]) -> AsyncIterator[bytes]:
+    """
+    Encode a TaskResultsResponse body one subtree at a time.
     
+    Headers flush before the large manifest/qa_report are serialized, and only
+    one subtree's encoding is in flight at once. Those two subtrees are encoded
+    in worker threads to keep them off the event loop, while the generator
+    itself (and so the _RESULTS_CACHE update) runs on the loop.
+    
+    Args:
+        task: Terminal task data from the state manager
+        
+    Yields:
+        JSON chunks; the full sequence is cached for later requests
+    """
+    manifest = qa_report = error = None
     if task["status"] == "completed" and task.get("result"):
         result = task["result"]
-        response.manifest = result.get("manifest")
-        response.qa_report = result.get("qa_report")
+        manifest = result.get("manifest")
+        qa_report = result.get("qa_report")
     elif task["status"] == "failed":
-        response.error = task.get("error", "Unknown error")
+        error = task.get("error", "Unknown error")
+    
+    chunks = [
+        b'{"task_id":' + dumps(task["task_id"]) + b',"status":' + dumps(task["status"]) + b',"manifest":'
+    ]
+    yield chunks[-1]
+    
+    chunks.append(await asyncio.to_thread(dumps, manifest))
+    yield chunks[-1]
     
-    return response
+    chunks.append(b',"qa_report":')
+    yield chunks[-1]
+    
+    chunks.append(await asyncio.to_thread(dumps, qa_report))
+    yield chunks[-1]
+    
+    chunks.append(
+        b',"execution_time_seconds":' + dumps(task.get("execution_time_seconds"))
+        + b',"error":' + dumps(error) + b'}'
+    )
+    yield chunks[-1]
+    
+    _RESULTS_CACHE[task["task_id"]] = (task["updated_at"], tuple(chunks))
+    if len(_RESULTS_CACHE) > _RESULTS_CACHE_SIZE:
+        _RESULTS_CACHE.popitem(last=False)
+
+
+def _final_frame(task_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
+    """Terminal WebSocket frame carrying the task's result or error."""
+    return {
+        "type": "final",
+        "task_id": task_id,
+        "status": task["status"],
+        "progress": 100.0 if task["status"] == "completed" else task["progress"],
+        "result": task.get("result"),
+        "error": task.get("error"),
+        "timestamp": _frame_timestamp()
+    }
 
 
 @app.websocket("/ws/progress/{task_id}")
@@ -174,43 +343,74 @@ async def websocket_progress(websocket: WebSocket, task_id: str):
     """
     WebSocket endpoint for real-time progress updates.
     """
-    await manager.connect(websocket, task_id)
+    await websocket.accept()
+    
+    # Subscribe before reading state so no frame published after the read is missed
+    queue = manager.subscribe(task_id)
     
     try:
-        # Send initial status
+        # Frames go out as binary: the codec already yields bytes, so no re-encode
+        send_bytes = websocket.send_bytes
+        
+        # Send initial status (every message is a JSON array of frames); one store read
         task = task_state.get_task(task_id)
         if task:
-            await websocket.send_text(json.dumps({
+            status = task["status"]
+            terminal = status in _TERMINAL_STATUSES
+            frames = [{
                 "type": "status",
                 "task_id": task_id,
-                "status": task["status"],
+                "status": status,
                 "progress": task["progress"],
                 "current_stage": task["current_stage"],
-                "timestamp": datetime.now().isoformat()
-            }))
+                "timestamp": _frame_timestamp()
+            }]
+            if terminal:
+                frames.append(_final_frame(task_id, task))
+            
+            await send_bytes(dumps(frames))
+            if terminal:
+                return
         
-        # Keep connection alive and send updates
+        # Forward published frames until the terminal one
         while True:
-            # Check for task updates
-            task = task_state.get_task(task_id)
-            if task and task["status"] in ["completed", "failed"]:
-                # Send final status and close
-                await websocket.send_text(json.dumps({
-                    "type": "final",
-                    "task_id": task_id,
-                    "status": task["status"],
-                    "progress": 100.0 if task["status"] == "completed" else task["progress"],
-                    "result": task.get("result"),
-                    "error": task.get("error"),
-                    "timestamp": datetime.now().isoformat()
-                }))
-                break
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=_WS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                # Quiet period (or the task is running in another worker); re-check the store
+                task = task_state.get_task(task_id)
+                if task and task["status"] in _TERMINAL_STATUSES:
+                    message = _final_frame(task_id, task)
+                else:
+                    message = {
+                        "type": "keepalive",
+                        "task_id": task_id,
+                        "timestamp": _frame_timestamp()
+                    }
             
-            # Wait before next check
-            await asyncio.sleep(1)
+            frames = [message]
+            final = message["type"] == "final"
+            if not final:
+                # Let a burst of stage updates accumulate, then send them together
+                await asyncio.sleep(_WS_COALESCE_SECONDS)
+                while not final and not queue.empty():
+                    message = queue.get_nowait()
+                    frames.append(message)
+                    final = message["type"] == "final"
+            
+            await send_bytes(dumps(frames))
+            if final:
+                break
             
     except WebSocketDisconnect:
-        manager.disconnect(task_id)
+        pass
+    
+    except RuntimeError as e:
+        # Send after the socket closed (e.g. client went away mid-batch)
+        logger.debug("websocket_send_failed", task_id=task_id, error=str(e))
+    
+    finally:
+        manager.unsubscribe(task_id, queue)
 
 
 @app.get("/health")
@@ -236,58 +436,69 @@ async def list_tasks():
 async def run_orchestrator_background(task_id: str, idea: str, industry: str):
     """
     Background task to run the orchestrator pipeline.
+    At most MAX_PIPELINES run at once; later tasks wait in the "queued" state.
     """
     # Setup task-specific logging
     task_logger = setup_task_logging(task_id)
     
-    try:
-        task_logger.info("orchestrator_background_started", task_id=task_id, idea=idea, industry=industry)
-        
-        # Update task status
-        task_state.update_status(task_id, "running", 0.0, "initialization")
-        
-        # Initialize orchestrator
-        orchestrator = GTMForgeOrchestrator()
-        
-        # Run pipeline with progress updates
-        await orchestrator.run_with_progress(
-            idea=idea,
-            industry=industry,
-            progress_callback=lambda stage, progress: update_task_progress(task_id, stage, progress)
-        )
-        
-        # Get final results
-        pipeline_state = orchestrator.get_pipeline_state()
-        
-        # Run QA validation
-        task_state.update_status(task_id, "running", 90.0, "qa_validation")
-        from app.agents.qa_agent.agent import QAAgent
-        qa_agent = QAAgent()
-        qa_report = await qa_agent.run(pipeline_state)
-        
-        # Run Publisher
-        task_state.update_status(task_id, "running", 95.0, "publishing")
-        from app.agents.publisher_agent.agent import PublisherAgent
-        publisher_agent = PublisherAgent(task_id=task_id)
-        publish_output = await publisher_agent.run(pipeline_state)
-        
-        # Store results
-        result = {
-            "manifest": publish_output.dict(),
-            "qa_report": qa_report.dict(),
-            "pipeline_state": pipeline_state.dict()
-        }
-        task_state.set_result(task_id, result)
-        task_state.update_status(task_id, "completed", 100.0, "completed")
+    if _PIPELINE_SEMAPHORE.locked():
+        # Already at MAX_PIPELINES; the task stays "queued" until a slot frees up
+        task_logger.info("orchestrator_background_waiting", task_id=task_id, max_pipelines=_MAX_PIPELINES)
+    
+    async with _PIPELINE_SEMAPHORE:
+        orchestrator = None
         
-        task_logger.info("orchestrator_background_completed", task_id=task_id)
+        try:
+            task_logger.info("orchestrator_background_started", task_id=task_id, idea=idea, industry=industry)
+            
+            # Update task status
+            task_state.update_status(task_id, "running", 0.0, "initialization")
+            
+            # Initialize orchestrator (per task: it holds this run's pipeline state)
+            orchestrator = GTMForgeOrchestrator()
+            
+            # Run pipeline with progress updates
+            await orchestrator.run_with_progress(
+                idea=idea,
+                industry=industry,
+                progress_callback=lambda stage, progress: update_task_progress(task_id, stage, progress)
+            )
+            
+            # Get final results
+            pipeline_state = orchestrator.get_pipeline_state()
+            
+            # Run QA validation with the orchestrator's agent instead of constructing another
+            task_state.update_status(task_id, "running", 90.0, "qa_validation")
+            qa_report = await orchestrator.qa_agent.run(pipeline_state)
+            
+            # Run Publisher (task_id is per call, so the orchestrator's instance is reused)
+            task_state.update_status(task_id, "running", 95.0, "publishing")
+            publish_output = await orchestrator.publisher_agent.run(pipeline_state, task_id=task_id)
+            
+            # Store results (dumping the nested models is CPU-bound; keep it off the event loop)
+            result = await asyncio.to_thread(lambda: {
+                "manifest": publish_output.model_dump(mode="json"),
+                "qa_report": qa_report.model_dump(mode="json"),
+                "pipeline_state": pipeline_state.model_dump(mode="json")
+            })
+            task_state.set_result(task_id, result)
+            task_state.update_status(task_id, "completed", 100.0, "completed")
+            manager.send_to_task(task_id, _final_frame(task_id, task_state.get_task(task_id)))
+            
+            task_logger.info("orchestrator_background_completed", task_id=task_id)
         
-    except Exception as e:
-        error_msg = f"Pipeline execution failed: {str(e)}"
-        task_logger.error("orchestrator_background_failed", task_id=task_id, error=error_msg)
+        except Exception as e:
+            error_msg = f"Pipeline execution failed: {str(e)}"
+            task_logger.error("orchestrator_background_failed", task_id=task_id, error=error_msg)
+            
+            task_state.set_error(task_id, error_msg)
+            task_state.update_status(task_id, "failed", 0.0, "failed")
+            manager.send_to_task(task_id, _final_frame(task_id, task_state.get_task(task_id)))
         
-        task_state.set_error(task_id, error_msg)
-        task_state.update_status(task_id, "failed", 0.0, "failed")
+        finally:
+            if orchestrator is not None:
+                await orchestrator.shutdown()
+            close_task_logging(task_id)
 
 
 def update_task_progress(task_id: str, stage: str, progress: float):
@@ -296,36 +507,67 @@ def update_task_progress(task_id: str, stage: str, progress: float):
     """
     task_state.update_status(task_id, "running", progress, stage)
     
-    # Send WebSocket update
-    asyncio.create_task(manager.send_to_task(task_id, {
+    # Publish to WebSocket subscribers
+    manager.send_to_task(task_id, {
         "type": "progress",
         "task_id": task_id,
         "stage": stage,
         "progress": progress,
-        "timestamp": datetime.now().isoformat()
-    }))
+        "timestamp": _frame_timestamp()
+    })
+
+
+# Old task logs are swept in the background at startup and then hourly
+_LOG_SWEEP_INTERVAL_SECONDS = 3600
+_log_sweeper: Optional[asyncio.Task] = None
+
+
+async def _sweep_task_logs():
+    """Periodically remove task logs older than 24h without blocking the event loop."""
+    while True:
+        cleaned = await asyncio.to_thread(cleanup_task_logs, 24)
+        print(f"Cleaned up {cleaned} old log files")
+        await asyncio.sleep(_LOG_SWEEP_INTERVAL_SECONDS)
 
 
 # Startup and shutdown events
 @app.on_event("startup")
 async def startup_event():
     """Initialize application on startup."""
-    # Clean up old logs
-    cleaned = cleanup_task_logs(max_age_hours=24)
-    print(f"Cleaned up {cleaned} old log files")
+    global _log_sweeper
+    # Clean up old logs concurrently so the worker is ready to serve immediately
+    _log_sweeper = asyncio.create_task(_sweep_task_logs())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
+    if _log_sweeper is not None:
+        _log_sweeper.cancel()
     print("GTMForge API shutting down")
 
 
 if __name__ == "__main__":
+    # The reloader is single-process and watches files; only enable it for development
+    reload = os.getenv("API_RELOAD", "false").lower() == "true"
+    
+    # One worker by default: WebSocket pub/sub (ConnectionManager), the pipeline
+    # semaphore and the encoded-response caches are per-process, so a client
+    # routed to another worker would never see its task's progress. Only raise
+    # API_WORKERS behind sticky routing until progress fan-out is cross-process.
+    workers = 1 if reload else int(os.getenv("API_WORKERS", "1"))
+    
     uvicorn.run(
         "api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=workers,
+        # uvloop/httptools when installed (uvicorn[standard]); stdlib fallbacks otherwise
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+        ws_per_message_deflate=True,
         log_level="info"
     )
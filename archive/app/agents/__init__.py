@@ -1,26 +1,37 @@
 """
 GTMForge Agents Package
 Contains all specialized agents for the GTMForge pipeline.
+
+Agent classes are imported on first attribute access (PEP 562), so importing
+the package only loads the agents a process actually uses.
 """
 
-from app.agents.ideation_agent.agent import IdeationAgent
-from app.agents.comparative_insight_agent.agent import ComparativeInsightAgent
-from app.agents.pitch_writer_agent.agent import PitchWriterAgent
-from app.agents.prompt_forge_agent.agent import PromptForgeAgent
-from app.agents.qa_agent.agent import QAAgent
-from app.agents.imagen_agent.agent import ImagenAgent
-from app.agents.veo_agent.agent import VeoAgent
-from app.agents.canva_agent.agent import CanvaAgent
-from app.agents.publisher_agent.agent import PublisherAgent
-
-__all__ = [
-    "IdeationAgent",
-    "ComparativeInsightAgent",
-    "PitchWriterAgent",
-    "PromptForgeAgent",
-    "QAAgent",
-    "ImagenAgent",
-    "VeoAgent",
-    "CanvaAgent",
-    "PublisherAgent",
-]
+import importlib
+
+_LAZY = {
+    "IdeationAgent": "app.agents.ideation_agent.agent",
+    "ComparativeInsightAgent": "app.agents.comparative_insight_agent.agent",
+    "PitchWriterAgent": "app.agents.pitch_writer_agent.agent",
+    "PromptForgeAgent": "app.agents.prompt_forge_agent.agent",
+    "QAAgent": "app.agents.qa_agent.agent",
+    "ImagenAgent": "app.agents.imagen_agent.agent",
+    "VeoAgent": "app.agents.veo_agent.agent",
+    "CanvaAgent": "app.agents.canva_agent.agent",
+    "PublisherAgent": "app.agents.publisher_agent.agent",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    attr = getattr(importlib.import_module(module_path), name)
+    globals()[name] = attr  # later lookups skip __getattr__
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -87,25 +87,22 @@ class CanvaAgent(BaseAgent):
                 deck_id=deck_id
             )
             
-            # Step 2: Add pages for each image
+            # Step 2: Create every image slide concurrently (upload + page in parallel, then place)
+            slide_results = await self.canva_client.create_slides_bulk(
+                deck_id,
+                [
+                    (i, image.local_path, f"Slide {image.slide_number}")
+                    for i, image in enumerate(input_data.images)
+                ],
+                image_position="center"
+            )
+            
             for i, image in enumerate(input_data.images):
                 try:
-                    # Add page
-                    page_result = await self.canva_client.add_page(
-                        deck_id=deck_id,
-                        title=f"Slide {image.slide_number}",
-                        position=i
-                    )
+                    if isinstance(slide_results[i], Exception):
+                        raise slide_results[i]
                     
-                    page_id = page_result["page_id"]
-                    
-                    # Add image to page
-                    await self.canva_client.place_image(
-                        deck_id=deck_id,
-                        page_id=page_id,
-                        image_path=image.local_path,
-                        position="center"
-                    )
+                    page_id = slide_results[i]["page_id"]
                     
                     page_info = CanvaPage(
                         page_number=i + 1,
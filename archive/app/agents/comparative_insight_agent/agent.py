@@ -12,6 +12,66 @@ from app.core.base_agent import BaseAgent
 from app.core.schemas import IdeationOutput, ComparativeInsightOutput, BenchmarkCompany
 
 
+# Phase 1 mock output is static: built and validated once at import, deep-copied per run
+_MOCK_OUTPUT = ComparativeInsightOutput(
+    benchmark_companies=[
+        BenchmarkCompany(
+            company_name="Benchmark Company A",
+            similarity_score=0.87,
+            key_strategies=[
+                "Direct B2B sales approach",
+                "Strategic partnerships with industry leaders",
+                "Product-led growth strategy"
+            ],
+            funding_stage="Series B",
+            market_approach="Enterprise-first, then SMB expansion"
+        ),
+        BenchmarkCompany(
+            company_name="Benchmark Company B",
+            similarity_score=0.76,
+            key_strategies=[
+                "Freemium model for user acquisition",
+                "Community-driven growth",
+                "Content marketing leadership"
+            ],
+            funding_stage="Series A",
+            market_approach="Bottom-up adoption, viral growth"
+        )
+    ],
+    gtm_strategies=[
+        "Start with a focused vertical market",
+        "Build strategic partnerships early",
+        "Implement product-led growth tactics",
+        "Focus on customer success and retention"
+    ],
+    market_positioning="Premium solution targeting mid-market and enterprise customers",
+    competitive_advantages=[
+        "First-mover advantage in specific niche",
+        "Superior technology stack",
+        "Strong network effects potential",
+        "Better unit economics than incumbents"
+    ],
+    potential_challenges=[
+        "Market education required for new category",
+        "Competition from established players",
+        "Multi-sided marketplace dynamics",
+        "Regulatory compliance considerations"
+    ],
+    investor_appeal_factors=[
+        "Large addressable market ($XB TAM)",
+        "High-growth trajectory potential",
+        "Strong founder-market fit",
+        "Proven GTM playbook from similar companies",
+        "Recurring revenue business model",
+        "Clear path to profitability"
+    ]
+)
+
+_MOCK_AVG_SIMILARITY = sum(
+    c.similarity_score for c in _MOCK_OUTPUT.benchmark_companies
+) / len(_MOCK_OUTPUT.benchmark_companies) if _MOCK_OUTPUT.benchmark_companies else 0
+
+
 class ComparativeInsightAgent(BaseAgent):
     """
     Comparative Insight Agent analyzes the startup idea against successful companies
@@ -64,68 +124,15 @@ class ComparativeInsightAgent(BaseAgent):
         # TODO: Use Gemini to extract and synthesize GTM strategies
         # TODO: Integrate vcprofile.mcp for investor preference tuning
         
-        # Phase 1: Return structured mock data
-        output = ComparativeInsightOutput(
-            benchmark_companies=[
-                BenchmarkCompany(
-                    company_name="Benchmark Company A",
-                    similarity_score=0.87,
-                    key_strategies=[
-                        "Direct B2B sales approach",
-                        "Strategic partnerships with industry leaders",
-                        "Product-led growth strategy"
-                    ],
-                    funding_stage="Series B",
-                    market_approach="Enterprise-first, then SMB expansion"
-                ),
-                BenchmarkCompany(
-                    company_name="Benchmark Company B",
-                    similarity_score=0.76,
-                    key_strategies=[
-                        "Freemium model for user acquisition",
-                        "Community-driven growth",
-                        "Content marketing leadership"
-                    ],
-                    funding_stage="Series A",
-                    market_approach="Bottom-up adoption, viral growth"
-                )
-            ],
-            gtm_strategies=[
-                "Start with a focused vertical market",
-                "Build strategic partnerships early",
-                "Implement product-led growth tactics",
-                "Focus on customer success and retention"
-            ],
-            market_positioning="Premium solution targeting mid-market and enterprise customers",
-            competitive_advantages=[
-                "First-mover advantage in specific niche",
-                "Superior technology stack",
-                "Strong network effects potential",
-                "Better unit economics than incumbents"
-            ],
-            potential_challenges=[
-                "Market education required for new category",
-                "Competition from established players",
-                "Multi-sided marketplace dynamics",
-                "Regulatory compliance considerations"
-            ],
-            investor_appeal_factors=[
-                "Large addressable market ($XB TAM)",
-                "High-growth trajectory potential",
-                "Strong founder-market fit",
-                "Proven GTM playbook from similar companies",
-                "Recurring revenue business model",
-                "Clear path to profitability"
-            ]
-        )
+        # Phase 1: Return structured mock data; a deep copy so no task shares lists
+        # or BenchmarkCompany instances with the template or with other tasks
+        output = _MOCK_OUTPUT.model_copy(deep=True)
         
         self.logger.info(
             "comparative_analysis_completed",
             benchmarks_found=len(output.benchmark_companies),
             strategies_identified=len(output.gtm_strategies),
-            avg_similarity_score=sum(
-                c.similarity_score for c in output.benchmark_companies
-            ) / len(output.benchmark_companies) if output.benchmark_companies else 0
+            avg_similarity_score=_MOCK_AVG_SIMILARITY
         )
         
         return output
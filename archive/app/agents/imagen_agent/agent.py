@@ -1,4 +1,5 @@
 
+import asyncio
 from typing import Type
 from pydantic import BaseModel
 from datetime import datetime
@@ -9,7 +10,7 @@ from google.adk import Agent
 from app.core.base_agent import BaseAgent
 from app.core.schemas import PromptForgeOutput, ImagenOutput, GeneratedImage
 from app.utils.real_api_clients import RealImagenClient
-from app.utils.config import AssetPathManager
+from app.utils.config import get_image_path
 
 
 class ImagenAgent(BaseAgent):
@@ -22,7 +23,7 @@ class ImagenAgent(BaseAgent):
     Output: ImagenOutput with generated image metadata and local paths
     
     Features:
-    - Sequential image generation from prompts
+    - Batched image generation: all pending prompts go to the client per round
     - Quality-based refinement loop (retry if quality < threshold)
     - Structured logging for each generation phase
     - Asset organization into /output/images/
@@ -73,70 +74,86 @@ class ImagenAgent(BaseAgent):
             max_retries=self.max_retries
         )
         
-        # Process each image prompt
-        for prompt_spec in input_data.image_prompts:
+        # Every prompt starts at iteration 0; each round sends all prompts that
+        # still need an image to the client as batches (one per aspect ratio)
+        pending = list(input_data.image_prompts)
+        accepted = {}
+        retry_count = 0
+        
+        for prompt_spec in pending:
             self.logger.info(
                 "image_prompt_processing_started",
                 prompt_id=prompt_spec.prompt_id,
                 target_slide=prompt_spec.target_slide
             )
+        
+        while pending:
+            batches = {}
+            for prompt_spec in pending:
+                aspect_ratio = prompt_spec.technical_params.get("aspect_ratio", "16:9")
+                batches.setdefault(aspect_ratio, []).append(prompt_spec)
             
-            # Attempt generation with refinement loop
-            retry_count = 0
-            image_generated = False
-            last_quality_score = 0.0
+            gen_start_time = datetime.now()
+            batch_results = await asyncio.gather(*(
+                self.imagen_client.generate_images_batch(
+                    prompts=[spec.prompt_text for spec in specs],
+                    slide_numbers=[spec.target_slide for spec in specs],
+                    aspect_ratio=aspect_ratio,
+                    quality="high",
+                    refinement_iteration=retry_count
+                )
+                for aspect_ratio, specs in batches.items()
+            ))
+            # Slides in a round are generated together, so each one is
+            # attributed the round's wall time
+            generation_time = (datetime.now() - gen_start_time).total_seconds()
+            total_generation_time += generation_time
             
-            while retry_count <= self.max_retries and not image_generated:
-                try:
-                    gen_start_time = datetime.now()
-                    
-                    # Generate image using client
-                    image_result = await self.imagen_client.generate_image(
-                        prompt=prompt_spec.prompt_text,
-                        slide_number=prompt_spec.target_slide,
-                        aspect_ratio=prompt_spec.technical_params.get("aspect_ratio", "16:9"),
-                        quality="high",
-                        refinement_iteration=retry_count
-                    )
-                    
-                    # Get absolute path using centralized manager
-                    image_path = AssetPathManager.get_image_path(
-                        image_id=image_result["image_id"],
-                        slide_number=prompt_spec.target_slide,
-                        iteration=retry_count
-                    )
-                    
-                    # Ensure the file exists - write to disk if provided image data
-                    if "image_data" in image_result:
-                        image_path.write_bytes(image_result["image_data"])
-                        self.logger.info(
-                            "image_file_written",
-                            path=str(image_path.absolute()),
-                            size_bytes=image_path.stat().st_size
+            retry_specs = []
+            for specs, results in zip(batches.values(), batch_results):
+                for prompt_spec, image_result in zip(specs, results):
+                    try:
+                        if isinstance(image_result, BaseException):
+                            raise image_result
+                        
+                        # Get absolute path using centralized manager
+                        image_path = get_image_path(
+                            image_id=image_result["image_id"],
+                            slide_number=prompt_spec.target_slide,
+                            iteration=retry_count
                         )
-                    elif not image_path.exists():
-                        # Create empty placeholder for mock
-                        image_path.write_bytes(b"MOCK_IMAGE_DATA")
+                        
+                        # Clients persist images themselves and return only the path
+                        if not image_path.exists():
+                            # Create empty placeholder for mock
+                            image_path.write_bytes(b"MOCK_IMAGE_DATA")
+                            self.logger.info(
+                                "mock_image_file_created",
+                                path=str(image_path.absolute())
+                            )
+                        
+                        last_quality_score = image_result.get("quality_score", 0.0)
+                        
                         self.logger.info(
-                            "mock_image_file_created",
-                            path=str(image_path.absolute())
+                            "image_generated",
+                            prompt_id=prompt_spec.prompt_id,
+                            quality_score=last_quality_score,
+                            generation_time_seconds=generation_time,
+                            retry_attempt=retry_count
                         )
-                    
-                    generation_time = (datetime.now() - gen_start_time).total_seconds()
-                    last_quality_score = image_result.get("quality_score", 0.0)
-                    
-                    self.logger.info(
-                        "image_generated",
-                        prompt_id=prompt_spec.prompt_id,
-                        quality_score=last_quality_score,
-                        generation_time_seconds=generation_time,
-                        retry_attempt=retry_count
-                    )
-                    
-                    # Check if quality meets threshold
-                    if last_quality_score >= self.quality_threshold:
-                        # Quality acceptable, add to results
-                        generated_image = GeneratedImage(
+                        
+                        # Below threshold with retries left: regenerate next round
+                        if last_quality_score < self.quality_threshold and retry_count < self.max_retries:
+                            self.logger.info(
+                                "image_retry_queued",
+                                prompt_id=prompt_spec.prompt_id,
+                                quality_score=last_quality_score,
+                                next_retry=retry_count + 1
+                            )
+                            retry_specs.append(prompt_spec)
+                            continue
+                        
+                        accepted[prompt_spec.prompt_id] = GeneratedImage(
                             image_id=image_result["image_id"],
                             slide_number=prompt_spec.target_slide,  # Use from prompt_spec
                             local_path=str(image_path.absolute()),  # Use absolute path
@@ -146,78 +163,50 @@ class ImagenAgent(BaseAgent):
                             prompt_used=prompt_spec.prompt_text,
                             refinement_iteration=retry_count
                         )
-                        generated_images.append(generated_image)
-                        quality_scores.append(last_quality_score)
-                        total_generation_time += generation_time
-                        image_generated = True
-                        
-                        self.logger.info(
-                            "image_accepted",
-                            prompt_id=prompt_spec.prompt_id,
-                            quality_score=last_quality_score,
-                            file_path=str(image_path.absolute())
-                        )
-                    
-                    else:
-                        # Quality below threshold, check if should retry
-                        should_retry = self.imagen_client.should_retry_image(
-                            quality_score=last_quality_score,
-                            quality_threshold=self.quality_threshold,
-                            retry_count=retry_count,
-                            max_retries=self.max_retries
-                        )
                         
-                        if should_retry:
+                        if last_quality_score >= self.quality_threshold:
                             self.logger.info(
-                                "image_retry_queued",
+                                "image_accepted",
                                 prompt_id=prompt_spec.prompt_id,
                                 quality_score=last_quality_score,
-                                next_retry=retry_count + 1
+                                file_path=str(image_path.absolute())
                             )
-                            retry_count += 1
-                            # Add small delay before retry
-                            await self._async_sleep(1.0)
-                        
                         else:
                             # Max retries reached, accept current image
-                            generated_image = GeneratedImage(
-                                image_id=image_result["image_id"],
-                                slide_number=prompt_spec.target_slide,  # Use from prompt_spec
-                                local_path=str(image_path.absolute()),  # Use absolute path
-                                url=image_result.get("url"),
-                                quality_score=last_quality_score,
-                                generation_time_seconds=generation_time,
-                                prompt_used=prompt_spec.prompt_text,
-                                refinement_iteration=retry_count
-                            )
-                            generated_images.append(generated_image)
-                            quality_scores.append(last_quality_score)
-                            total_generation_time += generation_time
-                            image_generated = True
-                            
                             self.logger.info(
                                 "image_accepted_max_retries",
                                 prompt_id=prompt_spec.prompt_id,
                                 quality_score=last_quality_score,
                                 retries_used=retry_count
                             )
-                
-                except Exception as e:
-                    error_msg = f"Image generation failed for {prompt_spec.prompt_id}: {str(e)}"
-                    self.logger.error(
-                        "image_generation_error",
-                        prompt_id=prompt_spec.prompt_id,
-                        error_message=error_msg,
-                        error_type=type(e).__name__,
-                        retry_attempt=retry_count
-                    )
-                    errors.append(error_msg)
                     
-                    if retry_count < self.max_retries:
-                        retry_count += 1
-                        await self._async_sleep(1.0)
-                    else:
-                        image_generated = True  # Give up after max retries
+                    except Exception as e:
+                        error_msg = f"Image generation failed for {prompt_spec.prompt_id}: {str(e)}"
+                        self.logger.error(
+                            "image_generation_error",
+                            prompt_id=prompt_spec.prompt_id,
+                            error_message=error_msg,
+                            error_type=type(e).__name__,
+                            retry_attempt=retry_count
+                        )
+                        errors.append(error_msg)
+                        
+                        # Give up on this prompt after max retries
+                        if retry_count < self.max_retries:
+                            retry_specs.append(prompt_spec)
+            
+            pending = retry_specs
+            if pending:
+                retry_count += 1
+                # Add small delay before the retry round
+                await self._async_sleep(1.0)
+        
+        # Results in prompt order, whichever round each image was accepted in
+        for prompt_spec in input_data.image_prompts:
+            generated_image = accepted.get(prompt_spec.prompt_id)
+            if generated_image is not None:
+                generated_images.append(generated_image)
+                quality_scores.append(generated_image.quality_score)
         
         # Calculate aggregate statistics
         average_quality_score = (
@@ -12,6 +12,68 @@ from app.core.base_agent import BaseAgent
 from app.core.schemas import ComparativeInsightOutput, PitchNarrativeOutput, SlideContent
 
 
+# Fixed slides as (title, key_message, talking_points, content_direction, data_points)
+_MARKET_OPPORTUNITY_SLIDE = (
+    "Market Opportunity",
+    "Large addressable market with strong growth trajectory",
+    (
+        "Significant TAM in target market",
+        "Multiple expansion opportunities identified",
+        "Proven willingness to pay from similar companies"
+    ),
+    "Market sizing visualization, growth charts",
+    ("TAM analysis", "Growth rate", "Market segments")
+)
+
+_TRACTION_SLIDE = (
+    "Traction",
+    "Early validation of product-market fit",
+    (
+        "Initial customer validation underway",
+        "Key partnerships in development",
+        "Product development milestones achieved"
+    ),
+    "Growth charts, customer logos, key metrics",
+    ("Customer count", "Growth rate", "Engagement metrics")
+)
+
+_BUSINESS_MODEL_SLIDE = (
+    "Business Model",
+    "Scalable revenue model with strong unit economics",
+    (
+        "Revenue streams and pricing strategy",
+        "Customer acquisition and lifetime value",
+        "Path to profitability"
+    ),
+    "Revenue model breakdown, pricing tiers",
+    ("ARR", "Gross margin", "CAC/LTV ratio")
+)
+
+_TEAM_SLIDE = (
+    "The Team",
+    "Experienced team with domain expertise",
+    (
+        "Founders with relevant background",
+        "Advisory board with industry connections",
+        "Key hires planned for growth"
+    ),
+    "Team photos, experience highlights",
+    None
+)
+
+_ASK_SLIDE = (
+    "The Ask",
+    "Seeking investment to accelerate growth",
+    (
+        "Funding amount and allocation",
+        "Key milestones to be achieved",
+        "Expected runway and next funding stage"
+    ),
+    "Use of funds breakdown, milestone timeline",
+    ("Raise amount", "Runway months", "Key hires")
+)
+
+
 class PitchWriterAgent(BaseAgent):
     """
     Pitch Writer Agent creates compelling pitch deck narratives with:
@@ -64,164 +126,96 @@ class PitchWriterAgent(BaseAgent):
         # TODO: Apply storytelling frameworks from prompts
         # TODO: Generate data visualizations recommendations
         
-        # Phase 1: Dynamically generate slides based on input data
-        slides = []
-        slide_num = 1
-        
-        # Slide 1: The Problem (derived from challenges)
-        if input_data.potential_challenges:
-            slides.append(SlideContent(
-                slide_number=slide_num,
-                slide_title="The Problem",
-                key_message=f"Critical challenges in the market: {input_data.potential_challenges[0]}",
-                talking_points=input_data.potential_challenges[:3],
-                content_direction="Bold problem statement with compelling statistics and visuals",
-                data_points=None
-            ))
-            slide_num += 1
+        # Phase 1: Dynamically generate slides based on input data.
+        # Bind input fields once; each spec is (title, key_message, talking_points,
+        # content_direction, data_points), or None when the slide doesn't apply.
+        challenges = input_data.potential_challenges
+        advantages = input_data.competitive_advantages
+        benchmarks = input_data.benchmark_companies
+        appeal_factors = input_data.investor_appeal_factors
+        positioning = input_data.market_positioning
         
-        # Slide 2: Our Solution (derived from market positioning)
-        slides.append(SlideContent(
-            slide_number=slide_num,
-            slide_title="Our Solution",
-            key_message=input_data.market_positioning,
-            talking_points=input_data.competitive_advantages[:3] if len(input_data.competitive_advantages) >= 3 else input_data.competitive_advantages,
-            content_direction="Product screenshots or demo flow, clean and modern",
-            data_points=None
-        ))
-        slide_num += 1
-        
-        # Slide 3: Market Opportunity (always include)
-        slides.append(SlideContent(
-            slide_number=slide_num,
-            slide_title="Market Opportunity",
-            key_message="Large addressable market with strong growth trajectory",
-            talking_points=[
-                "Significant TAM in target market",
-                "Multiple expansion opportunities identified",
-                "Proven willingness to pay from similar companies"
-            ],
-            content_direction="Market sizing visualization, growth charts",
-            data_points=["TAM analysis", "Growth rate", "Market segments"]
-        ))
-        slide_num += 1
-        
-        # Slide 4: Why Now (if we have benchmark companies showing timing)
-        if input_data.benchmark_companies:
-            why_now_points = []
-            for company in input_data.benchmark_companies[:2]:
-                why_now_points.append(f"{company.company_name} proved market timing with {company.funding_stage} funding")
-            
-            slides.append(SlideContent(
-                slide_number=slide_num,
-                slide_title="Why Now",
-                key_message="Market conditions are optimal for this solution",
-                talking_points=why_now_points + ["Technology enablers now mature", "Customer behavior has shifted"],
-                content_direction="Timeline showing market evolution and key milestones",
-                data_points=None
-            ))
-            slide_num += 1
-        
-        # Slide 5: Traction (placeholder for Phase 2)
-        slides.append(SlideContent(
-            slide_number=slide_num,
-            slide_title="Traction",
-            key_message="Early validation of product-market fit",
-            talking_points=[
-                "Initial customer validation underway",
-                "Key partnerships in development",
-                "Product development milestones achieved"
-            ],
-            content_direction="Growth charts, customer logos, key metrics",
-            data_points=["Customer count", "Growth rate", "Engagement metrics"]
-        ))
-        slide_num += 1
-        
-        # Slide 6: Competitive Advantages (derived from input)
-        if input_data.competitive_advantages:
-            slides.append(SlideContent(
-                slide_number=slide_num,
-                slide_title="Competitive Advantages",
-                key_message="Clear differentiation in the market",
-                talking_points=input_data.competitive_advantages,
-                content_direction="Competitive matrix or positioning map",
-                data_points=None
-            ))
-            slide_num += 1
-        
-        # Slide 7: Go-to-Market Strategy (derived from benchmarks)
-        slides.append(SlideContent(
-            slide_number=slide_num,
-            slide_title="Go-to-Market Strategy",
-            key_message="Proven playbook from successful companies",
-            talking_points=input_data.gtm_strategies,
-            content_direction="GTM timeline and channel strategy",
-            data_points=None
-        ))
-        slide_num += 1
-        
-        # Slide 8: Business Model (standard for all pitches)
-        slides.append(SlideContent(
-            slide_number=slide_num,
-            slide_title="Business Model",
-            key_message="Scalable revenue model with strong unit economics",
-            talking_points=[
-                "Revenue streams and pricing strategy",
-                "Customer acquisition and lifetime value",
-                "Path to profitability"
-            ],
-            content_direction="Revenue model breakdown, pricing tiers",
-            data_points=["ARR", "Gross margin", "CAC/LTV ratio"]
-        ))
-        slide_num += 1
-        
-        # Slide 9: The Team (standard)
-        slides.append(SlideContent(
-            slide_number=slide_num,
-            slide_title="The Team",
-            key_message="Experienced team with domain expertise",
-            talking_points=[
-                "Founders with relevant background",
-                "Advisory board with industry connections",
-                "Key hires planned for growth"
-            ],
-            content_direction="Team photos, experience highlights",
-            data_points=None
-        ))
-        slide_num += 1
+        slide_specs = (
+            # Slide 1: The Problem (derived from challenges)
+            (
+                "The Problem",
+                f"Critical challenges in the market: {challenges[0]}",
+                challenges[:3],
+                "Bold problem statement with compelling statistics and visuals",
+                None
+            ) if challenges else None,
+            # Slide 2: Our Solution (derived from market positioning)
+            (
+                "Our Solution",
+                positioning,
+                advantages[:3],
+                "Product screenshots or demo flow, clean and modern",
+                None
+            ),
+            # Slide 3: Market Opportunity (always include)
+            _MARKET_OPPORTUNITY_SLIDE,
+            # Slide 4: Why Now (if we have benchmark companies showing timing)
+            (
+                "Why Now",
+                "Market conditions are optimal for this solution",
+                [
+                    f"{company.company_name} proved market timing with {company.funding_stage} funding"
+                    for company in benchmarks[:2]
+                ] + ["Technology enablers now mature", "Customer behavior has shifted"],
+                "Timeline showing market evolution and key milestones",
+                None
+            ) if benchmarks else None,
+            # Slide 5: Traction (placeholder for Phase 2)
+            _TRACTION_SLIDE,
+            # Slide 6: Competitive Advantages (derived from input)
+            (
+                "Competitive Advantages",
+                "Clear differentiation in the market",
+                advantages,
+                "Competitive matrix or positioning map",
+                None
+            ) if advantages else None,
+            # Slide 7: Go-to-Market Strategy (derived from benchmarks)
+            (
+                "Go-to-Market Strategy",
+                "Proven playbook from successful companies",
+                input_data.gtm_strategies,
+                "GTM timeline and channel strategy",
+                None
+            ),
+            # Slides 8-9: Business Model and The Team (standard for all pitches)
+            _BUSINESS_MODEL_SLIDE,
+            _TEAM_SLIDE,
+            # Slide 10: Investor Appeal (derived from input)
+            (
+                "Investment Opportunity",
+                "Compelling opportunity for investors",
+                appeal_factors[:4],
+                "Key investment highlights with visual emphasis",
+                None
+            ) if appeal_factors else None,
+            # Slide 11: The Ask (standard closing)
+            _ASK_SLIDE,
+        )
         
-        # Slide 10: Investor Appeal (derived from input)
-        if input_data.investor_appeal_factors:
-            slides.append(SlideContent(
+        slides = [
+            SlideContent(
                 slide_number=slide_num,
-                slide_title="Investment Opportunity",
-                key_message="Compelling opportunity for investors",
-                talking_points=input_data.investor_appeal_factors[:4],
-                content_direction="Key investment highlights with visual emphasis",
-                data_points=None
-            ))
-            slide_num += 1
-        
-        # Slide 11: The Ask (standard closing)
-        slides.append(SlideContent(
-            slide_number=slide_num,
-            slide_title="The Ask",
-            key_message="Seeking investment to accelerate growth",
-            talking_points=[
-                "Funding amount and allocation",
-                "Key milestones to be achieved",
-                "Expected runway and next funding stage"
-            ],
-            content_direction="Use of funds breakdown, milestone timeline",
-            data_points=["Raise amount", "Runway months", "Key hires"]
-        ))
-        slide_num += 1
+                slide_title=title,
+                key_message=key_message,
+                talking_points=list(talking_points),
+                content_direction=content_direction,
+                data_points=list(data_points) if data_points else None
+            )
+            for slide_num, (title, key_message, talking_points, content_direction, data_points)
+            in enumerate(filter(None, slide_specs), 1)
+        ]
         
         # Generate elevator pitch dynamically
         elevator_pitch = (
-            f"We're addressing {input_data.potential_challenges[0] if input_data.potential_challenges else 'critical market challenges'} "
-            f"with {input_data.market_positioning}. "
-            f"We're leveraging proven strategies from {input_data.benchmark_companies[0].company_name if input_data.benchmark_companies else 'successful companies'}, "
+            f"We're addressing {challenges[0] if challenges else 'critical market challenges'} "
+            f"with {positioning}. "
+            f"We're leveraging proven strategies from {benchmarks[0].company_name if benchmarks else 'successful companies'}, "
             f"and we're positioned to capture significant market share."
         )
         
@@ -230,15 +224,15 @@ class PitchWriterAgent(BaseAgent):
         narrative_arc = " → ".join(narrative_components)
         
         # Determine target investor based on benchmark funding stages
-        if input_data.benchmark_companies:
-            stages = [c.funding_stage for c in input_data.benchmark_companies if c.funding_stage]
+        if benchmarks:
+            stages = [c.funding_stage for c in benchmarks if c.funding_stage]
             common_stage = stages[0] if stages else "Series A"
             target_profile = f"{common_stage} investors focused on similar market opportunities"
         else:
             target_profile = "Series A investors focused on high-growth opportunities"
         
         output = PitchNarrativeOutput(
-            deck_title=f"Pitch Deck - {input_data.market_positioning[:50]}",
+            deck_title=f"Pitch Deck - {positioning[:50]}",
             elevator_pitch=elevator_pitch,
             slides=slides,
             overall_narrative_arc=narrative_arc,
@@ -3,6 +3,7 @@ Prompt Forge Agent
 Generates and refines prompts for Imagen and Veo generation with loop logic.
 """
 
+import os
 from typing import Type
 from pydantic import BaseModel
 
@@ -12,6 +13,74 @@ from app.core.base_agent import BaseAgent
 from app.core.schemas import PitchNarrativeOutput, PromptForgeOutput, PromptSpec
 
 
+# Phase 1 prompt text is fixed apart from the slide fields; built once at import.
+# Specs get a shallow copy of the technical params; nested values are immutable,
+# so nothing mutable is shared between specs.
+_IMAGE_PROMPT_TEMPLATE = (
+    "Professional business presentation visual for '{title}'. "
+    "{direction}. Modern, clean aesthetic with "
+    "technology focus. High quality, 16:9 aspect ratio."
+)
+
+_IMAGE_STYLE_GUIDANCE = (
+    "Cinematic lighting, modern tech aesthetic, dark steel and tech blue "
+    "color palette, minimal text, professional photography style, "
+    "high contrast, sharp focus"
+)
+
+_COLOR_PALETTE = ("#1e3a5f", "#2d5f8d", "#ffffff", "#f0f0f0")
+
+_IMAGE_TECHNICAL_PARAMS = {
+    "aspect_ratio": "16:9",
+    "quality": "high",
+    "style": "professional",
+    "color_palette": _COLOR_PALETTE
+}
+
+_VIDEO_PROMPT_TEMPLATE = (
+    "Cinematic trailer for '{deck_title}'. "
+    "Opening with problem visualization, transitioning to solution, "
+    "showing growth and momentum. Professional, inspiring, modern tech aesthetic. "
+    "Duration: 30-60 seconds."
+)
+
+_VIDEO_STYLE_GUIDANCE = (
+    "Cinematic camera movements, dynamic transitions, "
+    "modern tech aesthetic, inspiring music, fast-paced editing, "
+    "professional grade video production"
+)
+
+_VIDEO_TECHNICAL_PARAMS = {
+    "duration_seconds": 45,
+    "aspect_ratio": "16:9",
+    "quality": "high",
+    "include_music": True,
+    "pacing": "dynamic"
+}
+
+_VISUAL_THEME = (
+    "Modern technology aesthetic with professional business presentation style. "
+    "Dark Steel (#1e3a5f) and Tech Blue (#2d5f8d) color palette. "
+    "Clean typography, minimal text, high-quality photography and renders. "
+    "Consistent lighting and visual language across all assets."
+)
+
+# Specs are built from validated pitch output, so construction skips validation;
+# set VALIDATE_PROMPT_SPECS=true (e.g. in CI) to re-check them
+_VALIDATE_PROMPT_SPECS = os.getenv("VALIDATE_PROMPT_SPECS", "false").lower() == "true"
+
+_BRAND_GUIDELINES = (
+    "1. Use Dark Steel and Tech Blue as primary colors\n"
+    "2. Maintain high contrast for readability\n"
+    "3. Keep text minimal and impactful\n"
+    "4. Use professional photography or clean renders\n"
+    "5. Ensure consistent lighting across all visuals\n"
+    "6. Apply modern, sans-serif typography\n"
+    "7. Maintain 16:9 aspect ratio for all slides\n"
+    "8. Use white space effectively"
+)
+
+
 class PromptForgeAgent(BaseAgent):
     """
     Prompt Forge Agent creates optimized prompts for visual asset generation:
@@ -49,6 +118,20 @@ class PromptForgeAgent(BaseAgent):
         """
         Generate and refine prompts for visual asset creation.
         
+        Args:
+            input_data: Pitch narrative with slide-by-slide content
+            
+        Returns:
+            Optimized prompts for Imagen and Veo generation
+        """
+        return self.run_sync(input_data)
+    
+    def run_sync(self, input_data: PitchNarrativeOutput) -> PromptForgeOutput:
+        """
+        Synchronous body of run(); Phase 1 prompt generation is pure CPU.
+        
+        Callers without an event loop can use this directly.
+        
         Args:
             input_data: Pitch narrative with slide-by-slide content
             
@@ -67,63 +150,39 @@ class PromptForgeAgent(BaseAgent):
         # TODO: Integrate with Gemini for prompt generation
         # TODO: Apply visual style guidelines from brand config
         
-        # Phase 1: Generate mock prompts for each slide
-        image_prompts = []
-        
-        for slide in input_data.slides:
-            # Create image prompt for this slide
-            prompt_spec = PromptSpec(
+        # Phase 1: Generate mock prompts for each slide (one image prompt per slide)
+        format_image_prompt = _IMAGE_PROMPT_TEMPLATE.format
+        image_prompts = [
+            PromptSpec.model_construct(
                 prompt_id=f"img_slide_{slide.slide_number}",
                 target_slide=slide.slide_number,
                 media_type="image",
-                prompt_text=(
-                    f"Professional business presentation visual for '{slide.slide_title}'. "
-                    f"{slide.content_direction}. Modern, clean aesthetic with "
-                    f"technology focus. High quality, 16:9 aspect ratio."
-                ),
-                style_guidance=(
-                    "Cinematic lighting, modern tech aesthetic, dark steel and tech blue "
-                    "color palette, minimal text, professional photography style, "
-                    "high contrast, sharp focus"
+                prompt_text=format_image_prompt(
+                    title=slide.slide_title,
+                    direction=slide.content_direction
                 ),
-                technical_params={
-                    "aspect_ratio": "16:9",
-                    "quality": "high",
-                    "style": "professional",
-                    "color_palette": ["#1e3a5f", "#2d5f8d", "#ffffff", "#f0f0f0"]
-                },
-                refinement_iteration=0
+                style_guidance=_IMAGE_STYLE_GUIDANCE,
+                technical_params=dict(_IMAGE_TECHNICAL_PARAMS)
             )
-            image_prompts.append(prompt_spec)
+            for slide in input_data.slides
+        ]
         
         # Create video prompt for trailer/intro
         video_prompts = [
-            PromptSpec(
+            PromptSpec.model_construct(
                 prompt_id="video_trailer",
                 target_slide=0,  # Not tied to specific slide
                 media_type="video",
-                prompt_text=(
-                    f"Cinematic trailer for '{input_data.deck_title}'. "
-                    f"Opening with problem visualization, transitioning to solution, "
-                    f"showing growth and momentum. Professional, inspiring, modern tech aesthetic. "
-                    f"Duration: 30-60 seconds."
-                ),
-                style_guidance=(
-                    "Cinematic camera movements, dynamic transitions, "
-                    "modern tech aesthetic, inspiring music, fast-paced editing, "
-                    "professional grade video production"
-                ),
-                technical_params={
-                    "duration_seconds": 45,
-                    "aspect_ratio": "16:9",
-                    "quality": "high",
-                    "include_music": True,
-                    "pacing": "dynamic"
-                },
-                refinement_iteration=0
+                prompt_text=_VIDEO_PROMPT_TEMPLATE.format(deck_title=input_data.deck_title),
+                style_guidance=_VIDEO_STYLE_GUIDANCE,
+                technical_params=dict(_VIDEO_TECHNICAL_PARAMS)
             )
         ]
         
+        if _VALIDATE_PROMPT_SPECS:
+            for spec in (*image_prompts, *video_prompts):
+                PromptSpec.model_validate(spec.model_dump())
+        
         # TODO Phase 2: Implement loop refinement logic here
         # Placeholder for refinement cycles
         refinement_cycles = 0
@@ -138,22 +197,8 @@ class PromptForgeAgent(BaseAgent):
         output = PromptForgeOutput(
             image_prompts=image_prompts,
             video_prompts=video_prompts,
-            visual_theme=(
-                "Modern technology aesthetic with professional business presentation style. "
-                "Dark Steel (#1e3a5f) and Tech Blue (#2d5f8d) color palette. "
-                "Clean typography, minimal text, high-quality photography and renders. "
-                "Consistent lighting and visual language across all assets."
-            ),
-            brand_guidelines=(
-                "1. Use Dark Steel and Tech Blue as primary colors\n"
-                "2. Maintain high contrast for readability\n"
-                "3. Keep text minimal and impactful\n"
-                "4. Use professional photography or clean renders\n"
-                "5. Ensure consistent lighting across all visuals\n"
-                "6. Apply modern, sans-serif typography\n"
-                "7. Maintain 16:9 aspect ratio for all slides\n"
-                "8. Use white space effectively"
-            ),
+            visual_theme=_VISUAL_THEME,
+            brand_guidelines=_BRAND_GUIDELINES,
             total_refinement_cycles=refinement_cycles
         )
         
@@ -3,19 +3,74 @@ Publisher Agent - Phase 3
 Uploads assets to GCS and builds manifest.json with signed URLs.
 """
 
+import asyncio
+import gzip
 import os
-import json
-import uuid
-from typing import Type, List, Dict, Any
+import secrets
+import time
+from collections import OrderedDict
+from typing import Type, List, Dict, Any, Iterator, NamedTuple, Optional, Tuple
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from google.adk import Agent
 
 from app.core.base_agent import BaseAgent
 from app.core.schemas import PipelineState, PublishOutput, ManifestAsset, QAReport
-from app.utils.google_clients import GoogleCloudStorageClient
+from app.utils.google_clients import get_gcs_client
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+# PublishOutput fields that make up manifest.json
+_MANIFEST_FIELDS = frozenset({
+    "manifest_id", "task_id", "created_at", "assets", "total_assets", "qa_status"
+})
+
+# Level 3 zstd is several times faster than gzip at a similar ratio on JSON
+_ZSTD_COMPRESSOR = zstandard.ZstdCompressor(level=3) if ZSTD_AVAILABLE else None
+
+
+def _compress_manifest(payload: bytes) -> Tuple[bytes, str]:
+    """Compress manifest.json for upload; returns (body, Content-Encoding)."""
+    if _ZSTD_COMPRESSOR is not None:
+        return _ZSTD_COMPRESSOR.compress(payload), "zstd"
+    return gzip.compress(payload, compresslevel=6), "gzip"
+
+
+class _AssetSpec(NamedTuple):
+    """One asset to publish: its upload_asset kwargs plus its manifest entry fields."""
+    upload: Dict[str, Any]
+    asset_id: str
+    asset_type: str
+    quality_score: float
+    fields: Dict[str, Any]
+    metadata: Dict[str, Any]
+    log_fields: Dict[str, Any]
+
+
+# Upload results remembered per (local_path, mtime_ns, asset_type)
+_UPLOAD_CACHE_SIZE = 1024
+
+# Published outputs remembered per (task_id, qa_status, asset identities)
+_MANIFEST_CACHE_SIZE = 256
+
+
+def _upload_keys(items: List[Dict[str, Any]]) -> List[Optional[Tuple[str, int, str]]]:
+    """Cache keys for file-backed uploads; None when the file is missing or absent."""
+    keys = []
+    for item in items:
+        path = item.get("local_path")
+        try:
+            keys.append((path, os.stat(path).st_mtime_ns, item["asset_type"]) if path else None)
+        except OSError:
+            keys.append(None)
+    return keys
 
 
 class PublisherAgent(BaseAgent):
@@ -37,7 +92,11 @@ class PublisherAgent(BaseAgent):
             version="1.0.0"
         )
         self.task_id = task_id
-        self.gcs_client = GoogleCloudStorageClient()
+        if task_id is not None:
+            self.set_context(task_id=task_id)
+        self.gcs_client = get_gcs_client()
+        self._upload_cache: "OrderedDict[Tuple[str, int, str], Dict[str, Any]]" = OrderedDict()
+        self._manifest_cache: "OrderedDict[tuple, PublishOutput]" = OrderedDict()
     
     @property
     def input_schema(self) -> Type[BaseModel]:
@@ -47,257 +106,315 @@ class PublisherAgent(BaseAgent):
     def output_schema(self) -> Type[BaseModel]:
         return PublishOutput
     
-    async def run(self, input_data: PipelineState) -> PublishOutput:
+    async def run(self, input_data: PipelineState, task_id: Optional[str] = None) -> PublishOutput:
         """
         Upload all assets to GCS and create manifest.json.
         
         Args:
             input_data: Complete pipeline state with all generated outputs
+            task_id: Task to publish for; defaults to the one given at construction,
+                so a single agent instance can be shared across tasks
             
         Returns:
             PublishOutput with manifest and all GCS URLs
         """
-        upload_start = datetime.now()
+        upload_start = time.perf_counter()
+        # One timestamp for the manifest and every asset in it
+        now_iso = datetime.now().isoformat()
+        task_id = task_id if task_id is not None else self.task_id
+        # A shared instance binds the per-call task once for this run's events
+        log = self.logger if task_id == self.task_id else self.logger.bind(task_id=task_id)
         
-        self.logger.info(
-            "publisher_started",
-            agent_name=self.name,
-            agent_version=self.version,
-            task_id=self.task_id
-        )
+        log.info("publisher_started")
         
         # Validate QA status
         if input_data.qa_output and input_data.qa_output.status == "failed":
             raise ValueError("Cannot publish assets with failed QA validation")
         
-        # Initialize manifest
-        manifest_id = f"manifest_{uuid.uuid4().hex[:12]}"
-        assets = []
-        errors = []
-        
-        # Upload images from Imagen output (nested in media_output)
-        if input_data.media_output and input_data.media_output.imagen_output:
-            imagen_assets = await self._upload_imagen_assets(
-                input_data.media_output.imagen_output, manifest_id
-            )
-            assets.extend(imagen_assets)
-        
-        # Upload videos from Veo output (nested in media_output)
-        if input_data.media_output and input_data.media_output.veo_output:
-            veo_assets = await self._upload_veo_assets(
-                input_data.media_output.veo_output, manifest_id
-            )
-            assets.extend(veo_assets)
-        
-        # Upload deck from Canva output (nested in media_output)
-        if input_data.media_output and input_data.media_output.canva_output:
-            canva_assets = await self._upload_canva_assets(
-                input_data.media_output.canva_output, manifest_id
-            )
-            assets.extend(canva_assets)
-        
-        # Create and upload manifest.json
-        manifest_data = {
-            "manifest_id": manifest_id,
-            "task_id": self.task_id,
-            "created_at": datetime.now().isoformat(),
-            "assets": [asset.dict() for asset in assets],
-            "total_assets": len(assets),
-            "qa_status": input_data.qa_output.status if input_data.qa_output else "not_validated"
-        }
+        # Upload images, videos and the deck (nested in media_output) as one
+        # bounded batch, so no asset type waits for another to finish
+        media = input_data.media_output
+        specs: List[_AssetSpec] = []
+        if media and media.imagen_output:
+            specs.extend(_imagen_specs(media.imagen_output))
+        if media and media.veo_output:
+            specs.extend(_veo_specs(media.veo_output))
+        if media and media.canva_output:
+            specs.extend(_canva_specs(media.canva_output))
         
-        # Upload manifest to GCS
-        manifest_path = f"manifests/{manifest_id}.json"
-        manifest_gcs_result = await self.gcs_client.upload_asset(
-            local_path=None,  # We'll upload JSON directly
-            asset_type="manifest",
-            metadata={"manifest_id": manifest_id, "task_id": self.task_id}
+        # Re-publishing unchanged state (retries, restarts) returns the earlier output;
+        # file mtimes in the key invalidate it when an asset is regenerated
+        upload_keys = await asyncio.to_thread(_upload_keys, [spec.upload for spec in specs])
+        qa_status = input_data.qa_output.status if input_data.qa_output else "not_validated"
+        manifest_key = (
+            task_id,
+            qa_status,
+            tuple((spec.asset_type, spec.asset_id, key) for spec, key in zip(specs, upload_keys))
         )
+        cached_output = self._manifest_cache.get(manifest_key)
+        if cached_output is not None:
+            self._manifest_cache.move_to_end(manifest_key)
+            log.info("publisher_manifest_reused", manifest_id=cached_output.manifest_id)
+            return cached_output
         
-        # Create manifest.json content
-        manifest_json = json.dumps(manifest_data, indent=2)
+        # Initialize manifest
+        manifest_id = f"manifest_{secrets.token_hex(6)}"
+        assets, errors = await self._upload_all(specs, now_iso, upload_keys, log=log)
         
         # For Phase 3, we'll simulate the upload since GCS client is mock
+        manifest_path = f"manifests/{manifest_id}.json"
         manifest_location = f"gs://gtmforge-assets/{manifest_path}"
         manifest_url = f"https://storage.googleapis.com/gtmforge-assets/{manifest_path}"
         
-        upload_duration = (datetime.now() - upload_start).total_seconds()
-        
         publish_output = PublishOutput(
             manifest_id=manifest_id,
-            task_id=self.task_id,
+            task_id=task_id,
             assets=assets,
-            created_at=datetime.now().isoformat(),
+            created_at=now_iso,
             manifest_location=manifest_location,
             manifest_url=manifest_url,
             total_assets=len(assets),
-            qa_status=input_data.qa_output.status if input_data.qa_output else "not_validated",
-            upload_duration_seconds=upload_duration,
+            qa_status=qa_status,
+            upload_duration_seconds=0.0,
             errors=errors
         )
         
-        self.logger.info(
+        # manifest.json is a projection of the output model, encoded once by pydantic-core
+        # straight to bytes (model_dump_json would build a str and then re-encode it)
+        manifest_json = PublishOutput.__pydantic_serializer__.to_json(
+            publish_output, include=_MANIFEST_FIELDS, indent=2
+        )
+        # Repeated keys and URL prefixes compress well; stored with Content-Encoding set
+        manifest_body, manifest_encoding = _compress_manifest(manifest_json)
+        
+        # Upload manifest to GCS
+        await self.gcs_client.upload_bytes(
+            manifest_body,
+            manifest_path,
+            asset_type="manifest",
+            content_type="application/json",
+            content_encoding=manifest_encoding,
+            metadata={"manifest_id": manifest_id, "task_id": task_id}
+        )
+        
+        # Duration covers the asset uploads and the manifest upload
+        upload_duration = time.perf_counter() - upload_start
+        publish_output.upload_duration_seconds = upload_duration
+        
+        log.info(
             "publisher_completed",
-            agent_name=self.name,
-            agent_version=self.version,
             manifest_id=manifest_id,
             total_assets=len(assets),
             upload_duration_seconds=upload_duration,
-            manifest_url=manifest_url
+            manifest_url=manifest_url,
+            manifest_bytes=len(manifest_json),
+            manifest_encoded_bytes=len(manifest_body),
+            manifest_encoding=manifest_encoding
         )
         
+        # Only fully published states are reused, so a retry re-attempts failed uploads
+        if not errors:
+            self._manifest_cache[manifest_key] = publish_output
+            if len(self._manifest_cache) > _MANIFEST_CACHE_SIZE:
+                self._manifest_cache.popitem(last=False)
+        
         return publish_output
     
-    async def _upload_imagen_assets(self, imagen_output, manifest_id: str) -> List[ManifestAsset]:
-        """Upload Imagen-generated images to GCS."""
-        assets = []
+    async def _upload_files(
+        self,
+        items: List[Dict[str, Any]],
+        keys: Optional[List[Optional[Tuple[str, int, str]]]] = None,
+        log: Optional[Any] = None
+    ) -> List[Any]:
+        """
+        Upload local files, reusing results for files already published unchanged.
         
-        for image in imagen_output.images:
-            try:
-                # Upload to GCS
-                gcs_result = await self.gcs_client.upload_asset(
-                    local_path=image.local_path,
-                    asset_type="image",
-                    metadata={
-                        "image_id": image.image_id,
-                        "slide_number": image.slide_number,
-                        "quality_score": image.quality_score
-                    }
-                )
-                
-                # Create manifest asset
-                asset = ManifestAsset(
-                    asset_id=image.image_id,
-                    asset_type="image",
-                    gcs_path=gcs_result["gcs_path"],
-                    gcs_url=gcs_result["gcs_url"],
-                    size_bytes=gcs_result.get("size_bytes", 0),
-                    quality_score=image.quality_score,
-                    generated_at=datetime.now().isoformat(),  # Use current timestamp
-                    slide_number=image.slide_number,
-                    metadata={
-                        "prompt_used": image.prompt_used,
-                        "refinement_iteration": image.refinement_iteration
-                    }
-                )
-                assets.append(asset)
-                
-                self.logger.info(
-                    "image_uploaded",
-                    asset_id=image.image_id,
-                    gcs_path=gcs_result["gcs_path"],
-                    size_bytes=asset.size_bytes
-                )
-                
-            except Exception as e:
-                self.logger.error(
-                    "image_upload_failed",
-                    asset_id=image.image_id,
-                    error=str(e)
-                )
+        Re-publishing a task (retries, orchestrator restarts) would otherwise
+        upload every asset again. Entries are keyed on the file's mtime, so a
+        regenerated file is uploaded afresh.
+        
+        Args:
+            items: List of upload_asset keyword-argument dicts
+            keys: Cache keys from _upload_keys(items), if already computed
+            log: Logger bound to the task being published (defaults to self.logger)
+            
+        Returns:
+            Upload results in the same order as items (exceptions for failures)
+        """
+        log = log or self.logger
+        if keys is None:
+            keys = await asyncio.to_thread(_upload_keys, items)
+        results: List[Any] = [None] * len(items)
+        misses = []
+        for index, key in enumerate(keys):
+            cached = self._upload_cache.get(key) if key else None
+            if cached is not None:
+                self._upload_cache.move_to_end(key)
+                results[index] = cached
+            else:
+                misses.append(index)
+        
+        if misses:
+            uploaded = await self.gcs_client.upload_assets([items[i] for i in misses])
+            for index, result in zip(misses, uploaded):
+                results[index] = result
+                if keys[index] and not isinstance(result, Exception):
+                    self._upload_cache[keys[index]] = result
+            while len(self._upload_cache) > _UPLOAD_CACHE_SIZE:
+                self._upload_cache.popitem(last=False)
         
-        return assets
+        log.debug(
+            "publisher_upload_cache",
+            total=len(items),
+            reused=len(items) - len(misses)
+        )
+        
+        return results
     
-    async def _upload_veo_assets(self, veo_output, manifest_id: str) -> List[ManifestAsset]:
-        """Upload Veo-generated videos to GCS."""
+    async def _upload_all(
+        self,
+        specs: List["_AssetSpec"],
+        generated_at: str,
+        upload_keys: Optional[List[Optional[Tuple[str, int, str]]]] = None,
+        log: Optional[Any] = None
+    ) -> Tuple[List[ManifestAsset], List[str]]:
+        """
+        Upload every asset in one batch and build manifest entries in order.
+        
+        Args:
+            specs: Assets of all types, as produced by the _*_specs helpers
+            generated_at: Timestamp recorded on every manifest entry
+            upload_keys: Upload cache keys for the specs, if already computed
+            log: Logger bound to the task being published (defaults to self.logger)
+            
+        Returns:
+            Manifest assets for the successful uploads, and one error message per
+            failed asset (failures are logged and left out of the manifest)
+        """
+        log = log or self.logger
         assets = []
+        failures = []
+        # upload_assets returns exceptions in place of results, so nothing is re-raised
+        upload_results = await self._upload_files([spec.upload for spec in specs], upload_keys, log=log)
         
-        for video in veo_output.videos:
+        for spec, gcs_result in zip(specs, upload_results):
+            if isinstance(gcs_result, Exception):
+                failures.append((spec, gcs_result))
+                continue
+            
             try:
-                # Upload to GCS
-                gcs_result = await self.gcs_client.upload_asset(
-                    local_path=video.local_path,
-                    asset_type="video",
-                    metadata={
-                        "video_id": video.video_id,
-                        "duration_seconds": video.duration_seconds,
-                        "quality_score": video.quality_score
-                    }
-                )
-                
                 # Create manifest asset
                 asset = ManifestAsset(
-                    asset_id=video.video_id,
-                    asset_type="video",
+                    asset_id=spec.asset_id,
+                    asset_type=spec.asset_type,
                     gcs_path=gcs_result["gcs_path"],
                     gcs_url=gcs_result["gcs_url"],
                     size_bytes=gcs_result.get("size_bytes", 0),
-                    quality_score=video.quality_score,
-                    generated_at=datetime.now().isoformat(),  # Use current timestamp
-                    duration_seconds=video.duration_seconds,
-                    metadata={
-                        "prompt_used": video.prompt_used,
-                        "source_images": video.source_images
-                    }
+                    quality_score=spec.quality_score,
+                    generated_at=generated_at,
+                    metadata=spec.metadata,
+                    **spec.fields
                 )
                 assets.append(asset)
                 
-                self.logger.info(
-                    "video_uploaded",
-                    asset_id=video.video_id,
+                log.info(
+                    f"{spec.asset_type}_uploaded",
+                    asset_id=spec.asset_id,
                     gcs_path=gcs_result["gcs_path"],
                     size_bytes=asset.size_bytes,
-                    duration_seconds=video.duration_seconds
+                    **spec.log_fields
                 )
                 
-            except Exception as e:
-                self.logger.error(
-                    "video_upload_failed",
-                    asset_id=video.video_id,
-                    error=str(e)
-                )
+            except (KeyError, ValidationError) as e:
+                # Malformed upload result
+                failures.append((spec, e))
         
-        return assets
-    
-    async def _upload_canva_assets(self, canva_output, manifest_id: str) -> List[ManifestAsset]:
-        """Upload Canva-generated deck to GCS."""
-        assets = []
+        errors = []
+        for spec, error in failures:
+            log.error(
+                f"{spec.asset_type}_upload_failed",
+                asset_id=spec.asset_id,
+                error=str(error)
+            )
+            errors.append(f"{spec.asset_type} {spec.asset_id}: {error}")
         
-        try:
-            # Upload deck to GCS (if we have a local file)
-            # For now, we'll create a mock upload since Canva output doesn't have local_path
-            gcs_result = await self.gcs_client.upload_asset(
-                local_path=None,  # Canva decks are typically cloud-based
-                asset_type="deck",
-                metadata={
-                    "deck_id": canva_output.deck_id,
-                    "total_pages": canva_output.total_pages,
-                    "creation_complete": canva_output.creation_complete
+        return assets, errors
+
+
+def _imagen_specs(imagen_output) -> Iterator[_AssetSpec]:
+    """Upload specs for Imagen-generated images."""
+    for image in imagen_output.images:
+        yield _AssetSpec(
+            upload={
+                "local_path": image.local_path,
+                "asset_type": "image",
+                "metadata": {
+                    "image_id": image.image_id,
+                    "slide_number": image.slide_number,
+                    "quality_score": image.quality_score
                 }
-            )
-            
-            # Create manifest asset
-            asset = ManifestAsset(
-                asset_id=canva_output.deck_id,
-                asset_type="deck",
-                gcs_path=gcs_result["gcs_path"],
-                gcs_url=gcs_result["gcs_url"],
-                size_bytes=gcs_result.get("size_bytes", 0),
-                quality_score=1.0,  # Assume perfect quality for Canva decks
-                generated_at=datetime.now().isoformat(),  # Use current timestamp
-                metadata={
-                    "total_pages": canva_output.total_pages,
-                    "creation_complete": canva_output.creation_complete,
-                    "deck_url": canva_output.deck_url
+            },
+            asset_id=image.image_id,
+            asset_type="image",
+            quality_score=image.quality_score,
+            fields={"slide_number": image.slide_number},
+            metadata={
+                "prompt_used": image.prompt_used,
+                "refinement_iteration": image.refinement_iteration
+            },
+            log_fields={}
+        )
+
+
+def _veo_specs(veo_output) -> Iterator[_AssetSpec]:
+    """Upload specs for Veo-generated videos."""
+    for video in veo_output.videos:
+        yield _AssetSpec(
+            upload={
+                "local_path": video.local_path,
+                "asset_type": "video",
+                "metadata": {
+                    "video_id": video.video_id,
+                    "duration_seconds": video.duration_seconds,
+                    "quality_score": video.quality_score
                 }
-            )
-            assets.append(asset)
-            
-            self.logger.info(
-                "deck_uploaded",
-                asset_id=canva_output.deck_id,
-                gcs_path=gcs_result["gcs_path"],
-                total_pages=canva_output.total_pages
-            )
-            
-        except Exception as e:
-            self.logger.error(
-                "deck_upload_failed",
-                asset_id=canva_output.deck_id,
-                error=str(e)
-            )
-        
-        return assets
+            },
+            asset_id=video.video_id,
+            asset_type="video",
+            quality_score=video.quality_score,
+            fields={"duration_seconds": video.duration_seconds},
+            metadata={
+                "prompt_used": video.prompt_used,
+                "source_images": video.source_images
+            },
+            log_fields={"duration_seconds": video.duration_seconds}
+        )
+
+
+def _canva_specs(canva_output) -> Iterator[_AssetSpec]:
+    """Upload spec for the Canva-generated deck."""
+    # Canva decks are cloud-based, so there is no local file to upload
+    yield _AssetSpec(
+        upload={
+            "local_path": None,
+            "asset_type": "deck",
+            "metadata": {
+                "deck_id": canva_output.deck_id,
+                "total_pages": canva_output.total_pages,
+                "creation_complete": canva_output.creation_complete
+            }
+        },
+        asset_id=canva_output.deck_id,
+        asset_type="deck",
+        quality_score=1.0,  # Assume perfect quality for Canva decks
+        fields={},
+        metadata={
+            "total_pages": canva_output.total_pages,
+            "creation_complete": canva_output.creation_complete,
+            "deck_url": canva_output.deck_url
+        },
+        log_fields={"total_pages": canva_output.total_pages}
+    )
 
 
 # ADK root_agent for A2A compatibility
@@ -15,7 +15,7 @@ from google.adk import Agent
 
 from app.core.base_agent import BaseAgent
 from app.core.schemas import PipelineState, QAReport, ImagenOutput, VeoOutput, CanvaOutput
-from app.utils.config import AssetPathManager
+from app.utils.config import get_image_path
 
 
 class QAAgent(BaseAgent):
@@ -62,8 +62,6 @@ class QAAgent(BaseAgent):
         
         self.logger.info(
             "qa_validation_started",
-            agent_name=self.name,
-            agent_version=self.version,
             max_retries=self.max_retries,
             quality_threshold=self.quality_threshold
         )
@@ -133,8 +131,6 @@ class QAAgent(BaseAgent):
         
         self.logger.info(
             "qa_validation_completed",
-            agent_name=self.name,
-            agent_version=self.version,
             status=status,
             total_assets=total_assets,
             assets_valid=assets_valid,
@@ -169,8 +165,8 @@ class QAAgent(BaseAgent):
                     
                     # Try to find file at original path
                     if not image_path.exists():
-                        # Try to reconstruct path using AssetPathManager
-                        reconstructed_path = AssetPathManager.get_image_path(
+                        # Try to reconstruct path using the asset path helpers
+                        reconstructed_path = get_image_path(
                             image_id=image.image_id,
                             slide_number=image.slide_number,
                             iteration=0
@@ -15,7 +15,7 @@ from google.adk import Agent
 from app.core.base_agent import BaseAgent
 from app.core.schemas import ImagenOutput, VeoOutput, GeneratedVideo
 from app.utils.real_api_clients import RealVeoClient
-from app.utils.config import AssetPathManager
+from app.utils.config import get_video_path
 
 
 class VeoAgent(BaseAgent):
@@ -108,20 +108,13 @@ class VeoAgent(BaseAgent):
                 )
                 
                 # Get absolute path using centralized manager
-                video_path = AssetPathManager.get_video_path(
+                video_path = get_video_path(
                     video_id=video_result["video_id"],
                     iteration=retry_count
                 )
                 
-                # Ensure the file exists - write to disk if provided video data
-                if "video_data" in video_result:
-                    video_path.write_bytes(video_result["video_data"])
-                    self.logger.info(
-                        "video_file_written",
-                        path=str(video_path.absolute()),
-                        size_bytes=video_path.stat().st_size
-                    )
-                elif not video_path.exists():
+                # Clients persist videos themselves and return only the path
+                if not video_path.exists():
                     # Create mock video file
                     video_path.write_bytes(b"MOCK_VIDEO_DATA")
                     self.logger.info(
@@ -4,10 +4,11 @@ Custom base class for all GTMForge agents with shared infrastructure.
 """
 
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any, Optional, Type
 from pydantic import BaseModel
 import structlog
-from datetime import datetime
+import time
 
 
 class BaseAgent(ABC):
@@ -41,10 +42,20 @@ class BaseAgent(ABC):
         self.name = name
         self.description = description
         self.version = version
+        # agent_name/agent_version are bound once; log calls need not repeat them
         self.logger = structlog.get_logger(agent_name=name, agent_version=version)
         self._execution_count = 0
         self._total_execution_time = 0.0
     
+    def set_context(self, **context: Any) -> None:
+        """
+        Bind extra context (e.g. task_id) to every subsequent log event.
+        
+        Args:
+            **context: Key-value pairs to bind to the agent's logger
+        """
+        self.logger = self.logger.bind(**context)
+    
     @property
     @abstractmethod
     def input_schema(self) -> Type[BaseModel]:
@@ -63,6 +74,16 @@ class BaseAgent(ABC):
         """
         pass
     
+    @cached_property
+    def _input_validator(self):
+        """The input schema's model_validate, resolved once per agent."""
+        return self.input_schema.model_validate
+    
+    @cached_property
+    def _output_type(self) -> Type[BaseModel]:
+        """The output schema class, resolved once per agent."""
+        return self.output_schema
+    
     @abstractmethod
     async def run(self, input_data: BaseModel) -> BaseModel:
         """
@@ -92,7 +113,7 @@ class BaseAgent(ABC):
             ValidationError: If input/output validation fails
             Exception: Any errors during execution
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         self._execution_count += 1
         
         # Log agent start
@@ -104,29 +125,30 @@ class BaseAgent(ABC):
         
         try:
             # Validate input
-            if isinstance(input_data, dict):
-                validated_input = self.input_schema(**input_data)
-            elif isinstance(input_data, BaseModel):
+            if isinstance(input_data, BaseModel):
                 validated_input = input_data
+            elif isinstance(input_data, dict):
+                validated_input = self._input_validator(input_data)
             else:
                 raise ValueError(f"Invalid input type: {type(input_data)}")
             
-            self.logger.debug("input_validated", schema=self.input_schema.__name__)
+            self.logger.debug("input_validated", schema=type(validated_input).__name__)
             
             # Execute the agent's logic
             output = await self.run(validated_input)
             
             # Validate output
-            if not isinstance(output, self.output_schema):
+            output_type = self._output_type
+            if not isinstance(output, output_type):
                 raise ValueError(
-                    f"Agent returned wrong type. Expected {self.output_schema.__name__}, "
+                    f"Agent returned wrong type. Expected {output_type.__name__}, "
                     f"got {type(output).__name__}"
                 )
             
-            self.logger.debug("output_validated", schema=self.output_schema.__name__)
+            self.logger.debug("output_validated", schema=output_type.__name__)
             
             # Log success
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             self._total_execution_time += execution_time
             
             self.logger.info(
@@ -140,7 +162,7 @@ class BaseAgent(ABC):
             
         except Exception as e:
             # Log failure
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             self.logger.error(
                 "agent_failed",
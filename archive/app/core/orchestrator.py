@@ -3,7 +3,8 @@ GTMForge Orchestrator
 Manages the multi-agent pipeline for GTM asset generation.
 """
 
-import uuid
+import asyncio
+import secrets
 from datetime import datetime
 from typing import Optional
 import structlog
@@ -43,18 +44,20 @@ class GTMForgeOrchestrator:
     5. QA Agent: Validate all content and assets
     
     Phase 2 Pipeline Extension (Media Generation):
-    6. Media Generation Stage (sequential):
+    6. Media Generation Stage:
        - Imagen Agent: Generate images from prompts
-       - Veo Agent: Generate video trailer from images
-       - Canva Agent: Create pitch deck with images
+       - Then, concurrently once Imagen finishes:
+         - Veo Agent: Generate video trailer from images
+         - Canva Agent: Create pitch deck with images
     7. Publisher Agent: Publish to GCS and Canva (Phase 3)
     
     Execution Patterns:
-    - Sequential: All stages run sequentially
+    - Sequential: Stages run in order; each consumes the previous stage's output
+    - Concurrent: Veo and Canva both depend only on Imagen, so they run together
     - Refinement Loops: Imagen/Veo retry if quality below threshold
     - Asset Aggregation: Media stage builds manifest of all assets
     
-    Phase 2: Sequential media generation with mock API calls
+    Phase 2: Media generation (Imagen, then Veo and Canva concurrently) with mock API calls
     Phase 3: Full GCS upload and Canva Connect integration
     """
     
@@ -127,7 +130,7 @@ class GTMForgeOrchestrator:
             Complete pipeline state with all agent outputs
         """
         # Create session
-        session_id = session_id or f"session_{uuid.uuid4().hex[:12]}"
+        session_id = session_id or f"session_{secrets.token_hex(6)}"
         self._current_session = session_id
         
         # Initialize pipeline state
@@ -296,14 +299,14 @@ class GTMForgeOrchestrator:
     async def _run_media_generation_stage(self) -> None:
         """
         Execute the Media Generation stage (Phase 2).
-        Runs Imagen → Veo → Canva sequentially to generate media assets.
+        Runs Imagen first, then Veo and Canva concurrently (both build on the images only).
         """
         stage_start_time = datetime.now()
         self._pipeline_state.current_stage = "media_generation"
         self.logger.info(
             "stage_started",
             stage="media_generation",
-            note="Phase 2: Sequential media generation"
+            note="Phase 2: Imagen, then Veo and Canva in parallel"
         )
         
         try:
@@ -326,26 +329,11 @@ class GTMForgeOrchestrator:
                 average_quality=imagen_output.average_quality_score
             )
             
-            # Stage 6b: Veo - Generate video trailer from images
-            self.logger.info("media_substage_started", substage="veo_generation")
-            veo_output = await self.veo_agent.execute(imagen_output)
-            self._pipeline_state.media_output.veo_output = veo_output
-            self.logger.info(
-                "media_substage_completed",
-                substage="veo_generation",
-                videos_generated=len(veo_output.videos),
-                average_quality=veo_output.average_quality_score
-            )
-            
-            # Stage 6c: Canva - Create pitch deck
-            self.logger.info("media_substage_started", substage="canva_deck_creation")
-            canva_output = await self.canva_agent.execute(imagen_output)
-            self._pipeline_state.media_output.canva_output = canva_output
-            self.logger.info(
-                "media_substage_completed",
-                substage="canva_deck_creation",
-                pages_created=canva_output.total_pages,
-                deck_id=canva_output.deck_id
+            # Stage 6b/6c: Veo trailer and Canva deck are independent branches
+            # off the images, so their API latencies overlap
+            veo_output, canva_output = await asyncio.gather(
+                self._run_veo_substage(imagen_output),
+                self._run_canva_substage(imagen_output)
             )
             
             # Build asset manifest from all media outputs
@@ -379,6 +367,32 @@ class GTMForgeOrchestrator:
             )
             raise
     
+    async def _run_veo_substage(self, imagen_output):
+        """Stage 6b: Veo - Generate video trailer from images."""
+        self.logger.info("media_substage_started", substage="veo_generation")
+        veo_output = await self.veo_agent.execute(imagen_output)
+        self._pipeline_state.media_output.veo_output = veo_output
+        self.logger.info(
+            "media_substage_completed",
+            substage="veo_generation",
+            videos_generated=len(veo_output.videos),
+            average_quality=veo_output.average_quality_score
+        )
+        return veo_output
+    
+    async def _run_canva_substage(self, imagen_output):
+        """Stage 6c: Canva - Create pitch deck."""
+        self.logger.info("media_substage_started", substage="canva_deck_creation")
+        canva_output = await self.canva_agent.execute(imagen_output)
+        self._pipeline_state.media_output.canva_output = canva_output
+        self.logger.info(
+            "media_substage_completed",
+            substage="canva_deck_creation",
+            pages_created=canva_output.total_pages,
+            deck_id=canva_output.deck_id
+        )
+        return canva_output
+    
     def _build_media_manifest(
         self,
         imagen_output,
@@ -474,6 +488,9 @@ class GTMForgeOrchestrator:
         # Close MCP connections
         await self.mcp_registry.close()
         
+        # Release pooled HTTP connections held by media clients
+        await self.canva_agent.canva_client.close()
+        
         self.logger.info("orchestrator_shutdown_complete")
     
     def get_agent_metadata(self) -> dict:
@@ -518,7 +535,7 @@ class GTMForgeOrchestrator:
         )
         
         # Initialize pipeline state
-        session_id = f"session_{uuid.uuid4().hex[:12]}"
+        session_id = f"session_{secrets.token_hex(6)}"
         self._current_session = session_id
         self._pipeline_state = PipelineState(
             session_id=session_id,
@@ -3,11 +3,18 @@ GTMForge Pydantic Schemas
 Defines all input/output models for agent communication in the pipeline.
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence, Literal
 from pydantic import BaseModel, Field
 from datetime import datetime
 
 
+# Shared immutable default for list-like fields. Agents always assign these
+# fields wholesale, so a fresh list per instance is never needed. Pydantic v2
+# already skips validating defaults (validate_default=False), so the tuple is
+# used as-is and is never copied into a list.
+_EMPTY_TUPLE: tuple = ()
+
+
 # ============================================================================
 # Input Schemas
 # ============================================================================
@@ -41,7 +48,7 @@ class ICP(BaseModel):
     """Ideal Customer Profile definition"""
     segment_name: str = Field(..., description="Name of the customer segment")
     demographics: str = Field(..., description="Demographic characteristics")
-    pain_points: List[str] = Field(default_factory=list, description="Key pain points for this segment")
+    pain_points: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Key pain points for this segment")
     behaviors: str = Field(..., description="Behavioral patterns and preferences")
 
 
@@ -51,11 +58,11 @@ class IdeationOutput(BaseModel):
     Expands the initial idea into structured ICPs, pain points, and market context.
     """
     expanded_idea: str = Field(..., description="Expanded and refined version of the original idea")
-    icps: List[ICP] = Field(default_factory=list, description="Identified Ideal Customer Profiles")
-    key_pain_points: List[str] = Field(default_factory=list, description="Primary pain points being addressed")
+    icps: Sequence[ICP] = Field(default=_EMPTY_TUPLE, description="Identified Ideal Customer Profiles")
+    key_pain_points: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Primary pain points being addressed")
     market_context: str = Field(..., description="Market landscape and opportunity context")
     value_proposition: str = Field(..., description="Core value proposition")
-    unique_differentiators: List[str] = Field(default_factory=list, description="Key differentiating factors")
+    unique_differentiators: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Key differentiating factors")
     
     class Config:
         json_schema_extra = {
@@ -81,7 +88,7 @@ class BenchmarkCompany(BaseModel):
     """Benchmark company comparison data"""
     company_name: str = Field(..., description="Name of the benchmark company")
     similarity_score: float = Field(..., description="Similarity to target startup (0-1)")
-    key_strategies: List[str] = Field(default_factory=list, description="Successful GTM strategies used")
+    key_strategies: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Successful GTM strategies used")
     funding_stage: Optional[str] = Field(None, description="Funding stage achieved")
     market_approach: str = Field(..., description="How they approached the market")
 
@@ -91,12 +98,12 @@ class ComparativeInsightOutput(BaseModel):
     Output from Comparative Insight Agent.
     Benchmarks the idea against successful startups using GTM playbook data.
     """
-    benchmark_companies: List[BenchmarkCompany] = Field(default_factory=list, description="Similar successful companies")
-    gtm_strategies: List[str] = Field(default_factory=list, description="Recommended GTM strategies based on benchmarks")
+    benchmark_companies: Sequence[BenchmarkCompany] = Field(default=_EMPTY_TUPLE, description="Similar successful companies")
+    gtm_strategies: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Recommended GTM strategies based on benchmarks")
     market_positioning: str = Field(..., description="Recommended market positioning")
-    competitive_advantages: List[str] = Field(default_factory=list, description="Competitive advantages identified")
-    potential_challenges: List[str] = Field(default_factory=list, description="Anticipated challenges from analysis")
-    investor_appeal_factors: List[str] = Field(default_factory=list, description="Factors that appeal to investors")
+    competitive_advantages: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Competitive advantages identified")
+    potential_challenges: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Anticipated challenges from analysis")
+    investor_appeal_factors: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Factors that appeal to investors")
     
     class Config:
         json_schema_extra = {
@@ -124,7 +131,7 @@ class SlideContent(BaseModel):
     slide_number: int = Field(..., description="Slide sequence number")
     slide_title: str = Field(..., description="Title of the slide")
     key_message: str = Field(..., description="Core message to convey")
-    talking_points: List[str] = Field(default_factory=list, description="Key talking points for this slide")
+    talking_points: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Key talking points for this slide")
     content_direction: str = Field(..., description="Visual content direction and style")
     data_points: Optional[List[str]] = Field(None, description="Key data points or metrics to highlight")
 
@@ -136,7 +143,7 @@ class PitchNarrativeOutput(BaseModel):
     """
     deck_title: str = Field(..., description="Title of the pitch deck")
     elevator_pitch: str = Field(..., description="30-second elevator pitch")
-    slides: List[SlideContent] = Field(default_factory=list, description="Slide-by-slide content")
+    slides: Sequence[SlideContent] = Field(default=_EMPTY_TUPLE, description="Slide-by-slide content")
     overall_narrative_arc: str = Field(..., description="The story arc connecting all slides")
     target_investor_profile: str = Field(..., description="Profile of target investors for this pitch")
     estimated_pitch_duration: int = Field(..., description="Estimated pitch duration in minutes")
@@ -167,7 +174,7 @@ class PromptSpec(BaseModel):
     """Specification for an Imagen or Veo generation prompt"""
     prompt_id: str = Field(..., description="Unique identifier for this prompt")
     target_slide: int = Field(..., description="Associated slide number")
-    media_type: str = Field(..., description="Type of media: 'image' or 'video'")
+    media_type: Literal["image", "video"] = Field(..., description="Type of media: 'image' or 'video'")
     prompt_text: str = Field(..., description="The actual generation prompt")
     style_guidance: str = Field(..., description="Style and aesthetic guidance")
     technical_params: Dict[str, Any] = Field(default_factory=dict, description="Technical parameters for generation")
@@ -179,8 +186,8 @@ class PromptForgeOutput(BaseModel):
     Output from Prompt Forge Agent.
     Optimized prompts for Imagen and Veo generation.
     """
-    image_prompts: List[PromptSpec] = Field(default_factory=list, description="Image generation prompts")
-    video_prompts: List[PromptSpec] = Field(default_factory=list, description="Video generation prompts")
+    image_prompts: Sequence[PromptSpec] = Field(default=_EMPTY_TUPLE, description="Image generation prompts")
+    video_prompts: Sequence[PromptSpec] = Field(default=_EMPTY_TUPLE, description="Video generation prompts")
     visual_theme: str = Field(..., description="Overall visual theme and style")
     brand_guidelines: str = Field(..., description="Brand consistency guidelines")
     total_refinement_cycles: int = Field(default=0, description="Number of refinement cycles performed")
@@ -209,7 +216,7 @@ class PromptForgeOutput(BaseModel):
 
 class ValidationIssue(BaseModel):
     """A validation issue found during QA"""
-    severity: str = Field(..., description="Severity level: 'critical', 'warning', 'info'")
+    severity: Literal["critical", "warning", "info"] = Field(..., description="Severity level: 'critical', 'warning', 'info'")
     category: str = Field(..., description="Category of issue")
     description: str = Field(..., description="Description of the issue")
     affected_component: str = Field(..., description="Which component is affected")
@@ -222,11 +229,11 @@ class QAValidationOutput(BaseModel):
     Validation results for all generated assets and content.
     """
     validation_passed: bool = Field(..., description="Overall validation pass/fail")
-    issues: List[ValidationIssue] = Field(default_factory=list, description="List of issues found")
+    issues: Sequence[ValidationIssue] = Field(default=_EMPTY_TUPLE, description="List of issues found")
     content_quality_score: float = Field(..., description="Content quality score 0-100")
     brand_consistency_score: float = Field(..., description="Brand consistency score 0-100")
     compliance_checks_passed: bool = Field(..., description="Whether compliance checks passed")
-    recommendations: List[str] = Field(default_factory=list, description="Overall recommendations")
+    recommendations: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Overall recommendations")
     
     class Config:
         json_schema_extra = {
@@ -262,7 +269,7 @@ class PublisherOutput(BaseModel):
     video_urls: Dict[str, str] = Field(default_factory=dict, description="Map of video IDs to GCS URLs")
     manifest_json_url: Optional[str] = Field(None, description="URL to the full manifest JSON")
     gcs_bucket: Optional[str] = Field(None, description="GCS bucket name where assets are stored")
-    status: str = Field(default="published", description="Publication status")
+    status: Literal["pending", "published", "failed"] = Field(default="published", description="Publication status")
     
     class Config:
         json_schema_extra = {
@@ -298,11 +305,11 @@ class ImagenOutput(BaseModel):
     Output from Imagen Agent.
     Generated images for all pitch deck slides.
     """
-    images: List[GeneratedImage] = Field(default_factory=list, description="Generated images")
+    images: Sequence[GeneratedImage] = Field(default=_EMPTY_TUPLE, description="Generated images")
     total_generation_time_seconds: float = Field(..., description="Total time for all image generations")
     average_quality_score: float = Field(..., description="Average quality across all images")
     generation_complete: bool = Field(default=True, description="Whether all requested images were generated")
-    errors: List[str] = Field(default_factory=list, description="Any generation errors encountered")
+    errors: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Any generation errors encountered")
     
     class Config:
         json_schema_extra = {
@@ -336,7 +343,7 @@ class GeneratedVideo(BaseModel):
     quality_score: float = Field(default=0.0, description="Quality score 0-1")
     generation_time_seconds: float = Field(..., description="Time taken to generate")
     prompt_used: str = Field(..., description="The actual prompt used for generation")
-    source_images: List[str] = Field(default_factory=list, description="Image IDs used as source")
+    source_images: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Image IDs used as source")
 
 
 class VeoOutput(BaseModel):
@@ -344,11 +351,11 @@ class VeoOutput(BaseModel):
     Output from Veo Agent.
     Generated video trailer from pitch deck imagery.
     """
-    videos: List[GeneratedVideo] = Field(default_factory=list, description="Generated videos")
+    videos: Sequence[GeneratedVideo] = Field(default=_EMPTY_TUPLE, description="Generated videos")
     total_generation_time_seconds: float = Field(..., description="Total time for all video generations")
     average_quality_score: float = Field(..., description="Average quality across all videos")
     generation_complete: bool = Field(default=True, description="Whether video generation succeeded")
-    errors: List[str] = Field(default_factory=list, description="Any generation errors encountered")
+    errors: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Any generation errors encountered")
     
     class Config:
         json_schema_extra = {
@@ -390,11 +397,11 @@ class CanvaOutput(BaseModel):
     """
     deck_id: str = Field(..., description="Canva design ID")
     deck_url: Optional[str] = Field(None, description="Canva shareable URL")
-    pages: List[CanvaPage] = Field(default_factory=list, description="Pages in the deck")
+    pages: Sequence[CanvaPage] = Field(default=_EMPTY_TUPLE, description="Pages in the deck")
     total_pages: int = Field(..., description="Total number of pages created")
     creation_complete: bool = Field(default=True, description="Whether deck creation succeeded")
     design_theme: str = Field(..., description="Applied design theme (e.g., Dark Steel + Tech Blue)")
-    errors: List[str] = Field(default_factory=list, description="Any creation errors encountered")
+    errors: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Any creation errors encountered")
     
     class Config:
         json_schema_extra = {
@@ -462,13 +469,13 @@ class QAReport(BaseModel):
     """
     QA validation report with comprehensive asset validation results.
     """
-    status: str = Field(..., description="Overall QA status: passed, failed, passed_with_warnings")
+    status: Literal["passed", "failed", "passed_with_warnings"] = Field(..., description="Overall QA status: passed, failed, passed_with_warnings")
     validation_timestamp: str = Field(..., description="ISO timestamp of validation")
     total_assets_checked: int = Field(..., description="Total number of assets validated")
     assets_valid: int = Field(..., description="Number of assets that passed validation")
     assets_invalid: int = Field(..., description="Number of assets that failed validation")
-    errors: List[Dict[str, str]] = Field(default_factory=list, description="List of {asset_id, error_message} for failed validations")
-    warnings: List[Dict[str, str]] = Field(default_factory=list, description="List of {asset_id, warning_message} for warnings")
+    errors: Sequence[Dict[str, str]] = Field(default=_EMPTY_TUPLE, description="List of {asset_id, error_message} for failed validations")
+    warnings: Sequence[Dict[str, str]] = Field(default=_EMPTY_TUPLE, description="List of {asset_id, warning_message} for warnings")
     metrics: Dict[str, Any] = Field(default_factory=dict, description="Validation metrics: dimensions, file_sizes, quality_scores, etc.")
     retry_summary: Dict[str, int] = Field(default_factory=dict, description="Retry counts by asset_type")
     validation_duration_seconds: float = Field(..., description="Total time spent on validation")
@@ -496,11 +503,11 @@ class PublishOutput(BaseModel):
     """
     manifest_id: str = Field(..., description="Unique manifest identifier")
     task_id: str = Field(..., description="Associated task ID")
-    assets: List[ManifestAsset] = Field(default_factory=list, description="List of all published assets")
+    assets: Sequence[ManifestAsset] = Field(default=_EMPTY_TUPLE, description="List of all published assets")
     created_at: str = Field(..., description="ISO timestamp when manifest was created")
     manifest_location: str = Field(..., description="GCS path to manifest.json")
     manifest_url: str = Field(..., description="Signed URL to access manifest.json")
     total_assets: int = Field(..., description="Total number of assets in manifest")
-    qa_status: str = Field(..., description="QA status from validation: passed, failed, passed_with_warnings")
+    qa_status: Literal["passed", "failed", "passed_with_warnings", "not_validated"] = Field(..., description="QA status from validation: passed, failed, passed_with_warnings")
     upload_duration_seconds: float = Field(..., description="Time spent uploading assets to GCS")
-    errors: List[str] = Field(default_factory=list, description="Any upload errors encountered")
\ No newline at end of file
+    errors: Sequence[str] = Field(default=_EMPTY_TUPLE, description="Any upload errors encountered")
\ No newline at end of file
@@ -1,22 +1,236 @@
 
 from typing import Optional, Dict, Any
+from collections import deque
 from datetime import datetime
-import uuid
+import asyncio
+import logging
+import secrets
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
 import structlog
 
+from app.utils.config import TASK_DB_PATH, ensure_dir
+from app.utils.logger import is_enabled_for
+from app.utils.serialization import dumps, loads
+
 logger = structlog.get_logger(__name__)
 
+# Terminal task statuses (frozenset for O(1) membership checks)
+_TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+# Buffered info-level events are flushed at this cadence (seconds)
+_LOG_FLUSH_INTERVAL = 0.1
+_LOG_QUEUE_MAXLEN = 8192
+
+# SQLite schema and prepared statements for the persistent task store
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL,
+    created_ts TEXT NOT NULL,
+    updated_ts TEXT NOT NULL,
+    blob BLOB NOT NULL
+)
+"""
+_CREATE_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)"
+_UPSERT_SQL = (
+    "INSERT OR REPLACE INTO tasks(task_id, status, progress, created_ts, updated_ts, blob) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SELECT_ONE_SQL = "SELECT blob FROM tasks WHERE task_id = ?"
+_SELECT_UPDATED_SQL = "SELECT updated_ts FROM tasks WHERE task_id = ?"
+_SELECT_ALL_SQL = "SELECT blob FROM tasks"
+_SELECT_BY_STATUS_SQL = "SELECT blob FROM tasks WHERE status = ?"
+_DELETE_SQL = "DELETE FROM tasks WHERE task_id = ?"
+
+
+def _timestamp_ns(value: Any) -> int:
+    """Task timestamp as epoch nanoseconds (also accepts ISO strings from older stores)."""
+    if isinstance(value, str):
+        return int(datetime.fromisoformat(value).timestamp() * 1_000_000_000)
+    return value
+
+
+def format_timestamp(value: Any) -> str:
+    """ISO-8601 string for a task timestamp, for API/serialization boundaries."""
+    if isinstance(value, str):
+        return value
+    return datetime.fromtimestamp(value / 1_000_000_000).isoformat()
+
 
 class TaskState:
     """
-    In-memory task state manager for tracking pipeline execution.
+    Task state manager for tracking pipeline execution.
     Stores task metadata, progress, and results.
+    
+    Tasks are persisted to SQLite (WAL mode) so state survives worker restarts
+    and can be read by other processes. The in-process dict caches decoded
+    tasks; each read checks the stored updated_ts and reloads the task when
+    another process has written it since. The database is opened on first use,
+    not at import.
+    
+    created_at/updated_at are stored as epoch nanoseconds (time.time_ns());
+    use format_timestamp() to render them.
     """
     
-    def __init__(self):
-        """Initialize empty task store."""
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize task store.
+        
+        Args:
+            db_path: SQLite database path. Defaults to TASK_DB_PATH; an empty
+                string disables persistence (in-memory only)
+        """
         self.tasks: Dict[str, Dict[str, Any]] = {}
-        logger.info("task_state_manager_initialized")
+        self._log_queue: deque = deque(maxlen=_LOG_QUEUE_MAXLEN)
+        self._flush_scheduled = False
+        self._db_lock = threading.Lock()
+        self._db_path = TASK_DB_PATH if db_path is None else db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_opened = False
+        logger.info("task_state_manager_initialized", persistent=bool(self._db_path))
+    
+    @property
+    def conn(self) -> Optional[sqlite3.Connection]:
+        """SQLite connection, opened on first access (None when persistence is off)."""
+        if not self._db_opened:
+            with self._db_lock:
+                if not self._db_opened:
+                    self._conn = self._open_db(self._db_path)
+                    self._db_opened = True
+        return self._conn
+    
+    def _open_db(self, db_path: str) -> Optional[sqlite3.Connection]:
+        """Open the SQLite task store, falling back to memory-only on failure."""
+        if not db_path:
+            return None
+        
+        try:
+            if db_path != ":memory:":
+                ensure_dir(Path(db_path).parent)
+            conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_CREATE_TABLE_SQL)
+            conn.execute(_CREATE_INDEX_SQL)
+            return conn
+        except sqlite3.Error as e:
+            logger.warning("task_db_unavailable", db_path=db_path, error=str(e))
+            return None
+    
+    def _persist(self, task: Dict[str, Any]) -> None:
+        """Write a task through to the SQLite store."""
+        if self.conn is None:
+            return
+        
+        with self._db_lock:
+            self.conn.execute(_UPSERT_SQL, (
+                task["task_id"],
+                task["status"],
+                task["progress"],
+                task["created_at"],
+                task["updated_at"],
+                dumps(task)
+            ))
+    
+    def _load(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Load a task from the SQLite store into the local cache."""
+        if self.conn is None:
+            return None
+        
+        with self._db_lock:
+            row = self.conn.execute(_SELECT_ONE_SQL, (task_id,)).fetchone()
+        
+        if row is None:
+            return None
+        
+        task = loads(row[0])
+        self.tasks[task_id] = task
+        return task
+    
+    def _load_all(self, status_filter: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Read all tasks through the shared store so other workers' tasks are included."""
+        with self._db_lock:
+            if status_filter:
+                rows = self.conn.execute(_SELECT_BY_STATUS_SQL, (status_filter,)).fetchall()
+            else:
+                rows = self.conn.execute(_SELECT_ALL_SQL).fetchall()
+        
+        stored_tasks = {}
+        for (blob,) in rows:
+            task_data = loads(blob)
+            stored_tasks[task_data["task_id"]] = task_data
+        return stored_tasks
+    
+    def _get_cached(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a task, reusing the cached copy only while it matches the store.
+        
+        Another process may have written the task since it was cached, so the
+        stored updated_ts is compared first and the blob is decoded again only
+        when it changed.
+        """
+        task = self.tasks.get(task_id)
+        if self.conn is None:
+            return task
+        
+        if task is not None:
+            with self._db_lock:
+                row = self.conn.execute(_SELECT_UPDATED_SQL, (task_id,)).fetchone()
+            if row is None:
+                # Removed from the store (e.g. by another worker's cleanup)
+                self.tasks.pop(task_id, None)
+                return None
+            if row[0] == str(task["updated_at"]):
+                return task
+        
+        return self._load(task_id)
+    
+    def _log(self, event: str, **fields: Any) -> None:
+        """
+        Buffer an info-level task event instead of emitting it synchronously.
+        
+        Events are flushed in one batch on the next event loop tick window,
+        or immediately when no loop is running (CLI/sync callers).
+        """
+        # Follows the level structlog was actually configured with
+        if not is_enabled_for(logging.INFO):
+            return
+        
+        self._log_queue.append((event, fields))
+        
+        if self._flush_scheduled:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_logs()
+            return
+        
+        self._flush_scheduled = True
+        loop.call_later(_LOG_FLUSH_INTERVAL, self.flush_logs)
+    
+    def flush_logs(self) -> int:
+        """
+        Emit all buffered task events.
+        
+        Returns:
+            Number of events flushed
+        """
+        self._flush_scheduled = False
+        flushed = 0
+        
+        while self._log_queue:
+            event, fields = self._log_queue.popleft()
+            logger.info(event, **fields)
+            flushed += 1
+        
+        return flushed
     
     def create_task(self, task_id: str, input_data: Dict[str, Any]) -> None:
         """
@@ -26,6 +240,7 @@ class TaskState:
             task_id: Unique task identifier
             input_data: Input parameters (idea, industry, etc.)
         """
+        now_ns = time.time_ns()
         self.tasks[task_id] = {
             "task_id": task_id,
             "status": "queued",
@@ -34,16 +249,17 @@ class TaskState:
             "input_data": input_data,
             "result": None,
             "error": None,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now_ns,
+            "updated_at": now_ns,
             "execution_time_seconds": None
         }
+        self._persist(self.tasks[task_id])
         
-        logger.info(
+        self._log(
             "task_created",
             task_id=task_id,
             status="queued",
-            input_keys=list(input_data.keys())
+            input_keys=tuple(input_data)
         )
     
     def update_status(self, task_id: str, status: str, progress: float = None, current_stage: str = None) -> None:
@@ -56,30 +272,35 @@ class TaskState:
             progress: Progress percentage (0.0-100.0)
             current_stage: Current pipeline stage
         """
-        if task_id not in self.tasks:
+        task = self._get_cached(task_id)
+        if task is None:
             logger.warning("task_not_found", task_id=task_id)
             return
         
-        task = self.tasks[task_id]
         old_status = task["status"]
         
+        # Intern small-vocabulary strings at the store boundary
+        status = sys.intern(status)
+        
         # Update fields
+        now_ns = time.time_ns()
         task["status"] = status
-        task["updated_at"] = datetime.now().isoformat()
+        task["updated_at"] = now_ns
         
         if progress is not None:
             task["progress"] = max(0.0, min(100.0, progress))
         
         if current_stage is not None:
-            task["current_stage"] = current_stage
+            task["current_stage"] = sys.intern(current_stage)
         
         # Calculate execution time if completed
-        if status in ["completed", "failed"]:
-            created_at = datetime.fromisoformat(task["created_at"])
-            execution_time = (datetime.now() - created_at).total_seconds()
+        if status in _TERMINAL_STATUSES:
+            execution_time = (now_ns - _timestamp_ns(task["created_at"])) / 1_000_000_000
             task["execution_time_seconds"] = execution_time
         
-        logger.info(
+        self._persist(task)
+        
+        self._log(
             "task_status_updated",
             task_id=task_id,
             old_status=old_status,
@@ -96,17 +317,19 @@ class TaskState:
             task_id: Task identifier
             result: Result data (manifest, qa_report, etc.)
         """
-        if task_id not in self.tasks:
+        task = self._get_cached(task_id)
+        if task is None:
             logger.warning("task_not_found", task_id=task_id)
             return
         
-        self.tasks[task_id]["result"] = result
-        self.tasks[task_id]["updated_at"] = datetime.now().isoformat()
+        task["result"] = result
+        task["updated_at"] = time.time_ns()
+        self._persist(task)
         
-        logger.info(
+        self._log(
             "task_result_set",
             task_id=task_id,
-            result_keys=list(result.keys()) if result else []
+            result_keys=tuple(result) if result else ()
         )
     
     def set_error(self, task_id: str, error: str) -> None:
@@ -117,12 +340,14 @@ class TaskState:
             task_id: Task identifier
             error: Error message
         """
-        if task_id not in self.tasks:
+        task = self._get_cached(task_id)
+        if task is None:
             logger.warning("task_not_found", task_id=task_id)
             return
         
-        self.tasks[task_id]["error"] = error
-        self.tasks[task_id]["updated_at"] = datetime.now().isoformat()
+        task["error"] = error
+        task["updated_at"] = time.time_ns()
+        self._persist(task)
         
         logger.error(
             "task_error_set",
@@ -140,7 +365,7 @@ class TaskState:
         Returns:
             Task data dictionary or None if not found
         """
-        task = self.tasks.get(task_id)
+        task = self._get_cached(task_id)
         
         if task:
             logger.debug("task_retrieved", task_id=task_id, status=task["status"])
@@ -159,16 +384,21 @@ class TaskState:
         Returns:
             Dictionary of task_id -> task_data
         """
+        if self.conn is not None:
+            stored_tasks = self._load_all(status_filter)
+            self._log("tasks_listed", count=len(stored_tasks), status_filter=status_filter)
+            return stored_tasks
+        
         if status_filter:
             filtered_tasks = {
                 task_id: task_data 
                 for task_id, task_data in self.tasks.items()
                 if task_data["status"] == status_filter
             }
-            logger.info("tasks_listed", count=len(filtered_tasks), status_filter=status_filter)
+            self._log("tasks_listed", count=len(filtered_tasks), status_filter=status_filter)
             return filtered_tasks
         else:
-            logger.info("tasks_listed", count=len(self.tasks))
+            self._log("tasks_listed", count=len(self.tasks))
             return self.tasks.copy()
     
     def cleanup_old_tasks(self, max_age_hours: int = 24) -> int:
@@ -181,19 +411,24 @@ class TaskState:
         Returns:
             Number of tasks cleaned up
         """
-        cutoff_time = datetime.now().timestamp() - (max_age_hours * 3600)
+        cutoff_ns = time.time_ns() - max_age_hours * 3600 * 1_000_000_000
         tasks_to_remove = []
         
-        for task_id, task_data in self.tasks.items():
-            if task_data["status"] in ["completed", "failed"]:
-                created_at = datetime.fromisoformat(task_data["created_at"]).timestamp()
-                if created_at < cutoff_time:
+        candidates = self._load_all() if self.conn is not None else self.tasks
+        
+        for task_id, task_data in candidates.items():
+            if task_data["status"] in _TERMINAL_STATUSES:
+                if _timestamp_ns(task_data["created_at"]) < cutoff_ns:
                     tasks_to_remove.append(task_id)
         
         for task_id in tasks_to_remove:
-            del self.tasks[task_id]
+            self.tasks.pop(task_id, None)
+        
+        if self.conn is not None and tasks_to_remove:
+            with self._db_lock:
+                self.conn.executemany(_DELETE_SQL, [(task_id,) for task_id in tasks_to_remove])
         
-        logger.info(
+        self._log(
             "old_tasks_cleaned",
             removed_count=len(tasks_to_remove),
             max_age_hours=max_age_hours
@@ -206,6 +441,6 @@ task_state = TaskState()
 
 
 def generate_task_id() -> str:
-    """Generate a unique task ID."""
-    return f"task_{uuid.uuid4().hex[:12]}"
+    """Generate a unique task ID (48 random bits, no UUID object allocation)."""
+    return f"task_{secrets.token_hex(6)}"
 
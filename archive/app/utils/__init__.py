@@ -3,13 +3,25 @@ GTMForge Utilities Module
 Contains logging, configuration, and helper utilities.
 """
 
-from app.utils.logger import setup_task_logging, cleanup_task_logs
-from app.utils.config import AssetPathManager, IMAGES_DIR, VIDEOS_DIR, ASSETS_DIR
+from app.utils.logger import setup_task_logging, close_task_logging, cleanup_task_logs
+from app.utils.config import (
+    AssetPathManager,
+    get_image_path,
+    get_video_path,
+    get_deck_path,
+    IMAGES_DIR,
+    VIDEOS_DIR,
+    ASSETS_DIR
+)
 
 __all__ = [
     "setup_task_logging",
+    "close_task_logging",
     "cleanup_task_logs",
     "AssetPathManager",
+    "get_image_path",
+    "get_video_path",
+    "get_deck_path",
     "IMAGES_DIR",
     "VIDEOS_DIR",
     "ASSETS_DIR"
@@ -4,78 +4,147 @@ Centralized configuration for paths, clients, and environment settings.
 """
 
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 import structlog
 
 logger = structlog.get_logger(__name__)
 
-# Base directory
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-OUTPUT_DIR = PROJECT_ROOT / "output"
-LOGS_DIR = PROJECT_ROOT / "logs"
+# Base directory (built as plain strings, wrapped in Path once each)
+_PROJECT_ROOT_STR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+_OUTPUT_DIR_STR = os.path.join(_PROJECT_ROOT_STR, "output")
+_ASSETS_DIR_STR = os.path.join(_OUTPUT_DIR_STR, "assets")
+_IMAGES_DIR_STR = os.path.join(_ASSETS_DIR_STR, "images")
+_VIDEOS_DIR_STR = os.path.join(_ASSETS_DIR_STR, "videos")
+_DECKS_DIR_STR = os.path.join(_ASSETS_DIR_STR, "decks")
+
+PROJECT_ROOT = Path(_PROJECT_ROOT_STR)
+OUTPUT_DIR = Path(_OUTPUT_DIR_STR)
+LOGS_DIR = Path(os.path.join(_PROJECT_ROOT_STR, "logs"))
 
 # Asset storage directories
-ASSETS_DIR = OUTPUT_DIR / "assets"
-IMAGES_DIR = ASSETS_DIR / "images"
-VIDEOS_DIR = ASSETS_DIR / "videos"
-DECKS_DIR = ASSETS_DIR / "decks"
+ASSETS_DIR = Path(_ASSETS_DIR_STR)
+IMAGES_DIR = Path(_IMAGES_DIR_STR)
+VIDEOS_DIR = Path(_VIDEOS_DIR_STR)
+DECKS_DIR = Path(_DECKS_DIR_STR)
+
+# Pre-stringified directory list for log payloads
+_DIRS_STR = (
+    _OUTPUT_DIR_STR,
+    str(LOGS_DIR),
+    _ASSETS_DIR_STR,
+    _IMAGES_DIR_STR,
+    _VIDEOS_DIR_STR,
+    _DECKS_DIR_STR
+)
+
+# Precomputed directory prefixes so per-asset paths are a single string concat
+_IMAGES_PREFIX = _IMAGES_DIR_STR + os.sep
+_VIDEOS_PREFIX = _VIDEOS_DIR_STR + os.sep
+_DECKS_PREFIX = _DECKS_DIR_STR + os.sep
+
+# Directories already created by this process (avoids repeated mkdir syscalls)
+_known_existing: set = set()
+_known_existing_lock = threading.Lock()
+
+
+def ensure_dir(path: Path) -> Path:
+    """Create a directory on first use; later calls are a lock-free set lookup."""
+    if path not in _known_existing:
+        # Paths are also resolved from executor threads; mkdir once per directory
+        with _known_existing_lock:
+            if path not in _known_existing:
+                path.mkdir(parents=True, exist_ok=True)
+                _known_existing.add(path)
+    return path
+
 
 # Ensure all directories exist
 def ensure_directories():
     """Create all necessary directories"""
     for directory in [OUTPUT_DIR, LOGS_DIR, ASSETS_DIR, IMAGES_DIR, VIDEOS_DIR, DECKS_DIR]:
-        directory.mkdir(parents=True, exist_ok=True)
-    logger.info("directories_ensured", directories=[
-        str(OUTPUT_DIR),
-        str(LOGS_DIR),
-        str(ASSETS_DIR),
-        str(IMAGES_DIR),
-        str(VIDEOS_DIR),
-        str(DECKS_DIR)
-    ])
-
-# Call on module load
-ensure_directories()
+        ensure_dir(directory)
+    logger.info("directories_ensured", directories=_DIRS_STR)
 
-class AssetPathManager:
-    """Centralized asset path management"""
-    
-    @staticmethod
-    def get_image_path(image_id: str, slide_number: int, iteration: int = 0) -> Path:
-        """Get absolute path for an image file"""
-        filename = f"imagen_slide_{slide_number}_{iteration}.png"
-        return IMAGES_DIR / filename
-    
-    @staticmethod
-    def get_video_path(video_id: str, iteration: int = 0) -> Path:
-        """Get absolute path for a video file"""
-        filename = f"{video_id}_{iteration}.mp4"
-        return VIDEOS_DIR / filename
-    
-    @staticmethod
-    def get_deck_path(deck_id: str) -> Path:
-        """Get absolute path for a deck file"""
-        filename = f"{deck_id}.pdf"
-        return DECKS_DIR / filename
-    
-    @staticmethod
-    def get_absolute_path(relative_path: str) -> Path:
-        """Convert relative path to absolute"""
-        if relative_path.startswith("/"):
-            return Path(relative_path)
-        return OUTPUT_DIR / relative_path.lstrip("./")
+
+# Path objects are immutable, so the formatted paths are memoized; retry loops
+# re-request the same slide/iteration paths repeatedly.
+@lru_cache(maxsize=2048)
+def _image_path(slide_number: int, iteration: int) -> Path:
+    return Path(f"{_IMAGES_PREFIX}imagen_slide_{slide_number}_{iteration}.png")
+
+
+@lru_cache(maxsize=1024)
+def _video_path(video_id: str, iteration: int) -> Path:
+    return Path(f"{_VIDEOS_PREFIX}{video_id}_{iteration}.mp4")
+
+
+@lru_cache(maxsize=1024)
+def _deck_path(deck_id: str) -> Path:
+    return Path(f"{_DECKS_PREFIX}{deck_id}.pdf")
+
+
+def get_image_path(image_id: str, slide_number: int, iteration: int = 0) -> Path:
+    """Get absolute path for an image file"""
+    ensure_dir(IMAGES_DIR)
+    return _image_path(slide_number, iteration)
+
+
+def get_video_path(video_id: str, iteration: int = 0) -> Path:
+    """Get absolute path for a video file"""
+    ensure_dir(VIDEOS_DIR)
+    return _video_path(video_id, iteration)
+
+
+def get_deck_path(deck_id: str) -> Path:
+    """Get absolute path for a deck file"""
+    ensure_dir(DECKS_DIR)
+    return _deck_path(deck_id)
+
+
+def get_absolute_path(relative_path: str) -> Path:
+    """Convert relative path to absolute"""
+    if relative_path.startswith("/"):
+        return Path(relative_path)
+    return OUTPUT_DIR / relative_path.lstrip("./")
+
+
+def ensure_file_exists(path: Path, create_empty: bool = False) -> bool:
+    """Check if file exists, optionally create empty file"""
+    if not create_empty:
+        return path.exists()
     
-    @staticmethod
-    def ensure_file_exists(path: Path, create_empty: bool = False) -> bool:
-        """Check if file exists, optionally create empty file"""
-        if path.exists():
+    # Assume the file is missing and create it in one syscall; EEXIST means it exists
+    for attempt in range(2):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            os.close(fd)
             return True
-        if create_empty:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.touch()
+        except FileExistsError:
             return True
-        return False
+        except FileNotFoundError:
+            if attempt:
+                raise
+            # Parent is missing (or was removed since it was cached); create it
+            _known_existing.discard(path.parent)
+            ensure_dir(path.parent)
+    return False
+
+
+class AssetPathManager:
+    """
+    Centralized asset path management.
+    Namespace kept for backwards compatibility; the module-level functions
+    are the primary API and skip the class attribute lookup.
+    """
+    
+    get_image_path = staticmethod(get_image_path)
+    get_video_path = staticmethod(get_video_path)
+    get_deck_path = staticmethod(get_deck_path)
+    get_absolute_path = staticmethod(get_absolute_path)
+    ensure_file_exists = staticmethod(ensure_file_exists)
 
 # Google Cloud Configuration
 GCP_PROJECT_ID = os.getenv("GCP_PROJECT_ID", "gtmforge-475520")
@@ -91,6 +160,7 @@ LOG_RETENTION_HOURS = int(os.getenv("LOG_RETENTION_HOURS", "24"))
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
 RETRY_BACKOFF_BASE = float(os.getenv("RETRY_BACKOFF_BASE", "2.0"))
 QUALITY_THRESHOLD = float(os.getenv("QUALITY_THRESHOLD", "0.8"))
+TASK_DB_PATH = os.getenv("TASK_DB_PATH", str(OUTPUT_DIR / "tasks.db"))
 
 # API Configuration
 API_HOST = os.getenv("API_HOST", "0.0.0.0")
@@ -98,10 +168,11 @@ API_PORT = int(os.getenv("API_PORT", "8000"))
 API_WORKERS = int(os.getenv("API_WORKERS", "4"))
 API_TIMEOUT = int(os.getenv("API_TIMEOUT", "3600"))
 
-logger.info(
-    "config_loaded",
-    project_root=str(PROJECT_ROOT),
-    output_dir=str(OUTPUT_DIR),
-    gcp_project=GCP_PROJECT_ID,
-    gcs_bucket=GCS_BUCKET_NAME
-)
\ No newline at end of file
+_CONFIG_LOG_KW = {
+    "project_root": _PROJECT_ROOT_STR,
+    "output_dir": _OUTPUT_DIR_STR,
+    "gcp_project": GCP_PROJECT_ID,
+    "gcs_bucket": GCS_BUCKET_NAME
+}
+
+logger.info("config_loaded", **_CONFIG_LOG_KW)
\ No newline at end of file
@@ -7,10 +7,41 @@ Phase 3: Adds per-task log files to /logs folder.
 import os
 import sys
 import logging
+from collections import OrderedDict
 import structlog
 from structlog.processors import JSONRenderer
 from pathlib import Path
 
+from app.utils.serialization import ORJSON_AVAILABLE, log_serializer, log_serializer_bytes
+
+# Numeric level applied by the last configure_logging() call
+_log_level = logging.INFO
+
+# Bound loggers handed out by get_logger, reused per (name, context). The context
+# can carry per-task values, so the cache is a bounded LRU rather than a plain dict
+_LOGGER_CACHE_SIZE = 256
+_logger_cache: "OrderedDict[tuple, structlog.BoundLogger]" = OrderedDict()
+
+# Per-task loggers from setup_task_logging; close_task_logging removes the entry
+_task_loggers: dict = {}
+
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _render_stack_and_exc(logger, method_name: str, event_dict: dict) -> dict:
+    """
+    Run StackInfoRenderer / format_exc_info only for events that need them.
+    
+    Most records carry neither stack_info nor exc_info, so they skip both
+    processors with two key lookups.
+    """
+    if "stack_info" in event_dict:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+    if "exc_info" in event_dict:
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
 
 def configure_logging(
     log_level: str = None,
@@ -31,19 +62,30 @@ def configure_logging(
         app_env = os.getenv("APP_ENV", "development").lower()
         json_format = app_env == "production"
     
+    global _log_level
+    _log_level = logging.getLevelName(log_level.upper())
+    if not isinstance(_log_level, int):
+        _log_level = logging.INFO
+    
     # Configure processors
     processors = [
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.contextvars.merge_contextvars,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        _render_stack_and_exc,
     ]
     
+    logger_factory = structlog.PrintLoggerFactory(file=sys.stdout)
+    stdout_buffer = getattr(sys.stdout, "buffer", None)
+    
     # Add appropriate renderer based on environment
-    if json_format:
+    if json_format and ORJSON_AVAILABLE and stdout_buffer is not None:
+        # Production: orjson emits bytes straight to stdout, no str round-trip
+        processors.append(JSONRenderer(serializer=log_serializer_bytes))
+        logger_factory = structlog.BytesLoggerFactory(file=stdout_buffer)
+    elif json_format:
         # Production: JSON format for log aggregation
-        processors.append(JSONRenderer())
+        processors.append(JSONRenderer(serializer=log_serializer))
     else:
         # Development: Human-readable console output
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
@@ -52,11 +94,28 @@ def configure_logging(
     structlog.configure(
         processors=processors,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        # Calls below the configured level are no-ops before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(_log_level),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
+def is_enabled_for(level: int) -> bool:
+    """
+    Check whether events at a stdlib log level will be emitted.
+    
+    Lets hot paths skip building log payloads that would be dropped.
+    
+    Args:
+        level: Stdlib log level (e.g. logging.INFO)
+        
+    Returns:
+        True if the configured level lets the event through
+    """
+    return level >= _log_level
+
+
 def setup_task_logging(task_id: str) -> structlog.BoundLogger:
     """
     Setup per-task logging to /logs/task_{task_id}.log file.
@@ -67,6 +126,11 @@ def setup_task_logging(task_id: str) -> structlog.BoundLogger:
     Returns:
         Logger bound to task context
     """
+    # Repeat calls reuse the handler and logger instead of stacking duplicates
+    cached = _task_loggers.get(task_id)
+    if cached is not None:
+        return cached
+    
     # Ensure logs directory exists
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
@@ -95,10 +159,25 @@ def setup_task_logging(task_id: str) -> structlog.BoundLogger:
     # Create structlog logger bound to task
     bound_logger = structlog.get_logger(f"task_{task_id}")
     bound_logger = bound_logger.bind(task_id=task_id)
+    _task_loggers[task_id] = bound_logger
     
     return bound_logger
 
 
+def close_task_logging(task_id: str) -> None:
+    """
+    Close the per-task log file once the task has finished.
+    
+    Args:
+        task_id: Unique task identifier passed to setup_task_logging
+    """
+    _task_loggers.pop(task_id, None)
+    task_logger = logging.getLogger(f"task_{task_id}")
+    for handler in list(task_logger.handlers):
+        task_logger.removeHandler(handler)
+        handler.close()
+
+
 def cleanup_task_logs(max_age_hours: int = 24) -> int:
     """
     Clean up old task log files.
@@ -110,19 +189,28 @@ def cleanup_task_logs(max_age_hours: int = 24) -> int:
         Number of log files cleaned up
     """
     import time
-    from datetime import datetime, timedelta
-    
-    logs_dir = Path("logs")
-    if not logs_dir.exists():
-        return 0
     
     cutoff_time = time.time() - (max_age_hours * 3600)
     cleaned_count = 0
     
-    for log_file in logs_dir.glob("task_*.log"):
-        if log_file.stat().st_mtime < cutoff_time:
-            log_file.unlink()
-            cleaned_count += 1
+    # scandir yields names from the directory read itself, without a Path per entry
+    try:
+        entries = os.scandir("logs")
+    except FileNotFoundError:
+        return 0
+    
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith("task_") and name.endswith(".log")):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff_time:
+                    os.unlink(entry.path)
+                    cleaned_count += 1
+            except FileNotFoundError:
+                # Removed concurrently (e.g. by another worker's sweep)
+                continue
     
     return cleaned_count
 
@@ -138,9 +226,23 @@ def get_logger(name: str = None, **initial_context) -> structlog.BoundLogger:
     Returns:
         Configured structlog logger
     """
+    try:
+        key = (name, frozenset(initial_context.items()))
+        cached = _logger_cache.get(key)
+    except TypeError:
+        # Unhashable context values: build a fresh logger every time
+        key = cached = None
+    if cached is not None:
+        _logger_cache.move_to_end(key)
+        return cached
+    
     logger = structlog.get_logger(name)
     if initial_context:
         logger = logger.bind(**initial_context)
+    if key is not None:
+        _logger_cache[key] = logger
+        if len(_logger_cache) > _LOGGER_CACHE_SIZE:
+            _logger_cache.popitem(last=False)
     return logger
 
 
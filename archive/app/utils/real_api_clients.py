@@ -4,47 +4,286 @@ Toggle between mock and real using environment variables.
 """
 
 import os
-import base64
+import asyncio
+import hashlib
+import itertools
+import shutil
+import random
+import struct
+import time
 import uuid
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import structlog
 
-# Try importing real API libraries
 try:
-    import vertexai
-    from vertexai.preview.vision_models import ImageGenerationModel
-    VERTEX_AI_AVAILABLE = True
-    # VideoGenerationModel may not be available yet in current SDK
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+
+from app.utils.config import get_image_path, get_video_path, IMAGES_DIR, VIDEOS_DIR
+
+logger = structlog.get_logger(__name__)
+
+
+# Heavy SDKs (vertexai, aiohttp, PIL) are imported on the first real code path
+# that needs them, so USE_MOCK_APIS runs never pay their import cost.
+@lru_cache(maxsize=1)
+def _vision_models():
+    """Vertex AI vision_models module, or None when the SDK is missing."""
     try:
-        from vertexai.preview.vision_models import VideoGenerationModel
-        VEO_AVAILABLE = True
+        from vertexai.preview import vision_models
     except ImportError:
-        VEO_AVAILABLE = False
-        structlog.get_logger(__name__).info("Veo not available in current SDK, will use mock")
-except ImportError:
-    VERTEX_AI_AVAILABLE = False
-    VEO_AVAILABLE = False
-    structlog.get_logger(__name__).warning("vertexai not available, will use mock implementations")
+        logger.warning("vertexai not available, will use mock implementations")
+        return None
+    return vision_models
 
-try:
-    import aiohttp
-    AIOHTTP_AVAILABLE = True
-except ImportError:
-    AIOHTTP_AVAILABLE = False
-    structlog.get_logger(__name__).warning("aiohttp not available, Canva API will be mocked")
 
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    structlog.get_logger(__name__).warning("PIL not available, image validation will be limited")
+@lru_cache(maxsize=1)
+def _aiohttp():
+    """aiohttp module, or None when it is not installed."""
+    try:
+        import aiohttp
+    except ImportError:
+        logger.warning("aiohttp not available, Canva API will be mocked")
+        return None
+    return aiohttp
 
-from app.utils.config import AssetPathManager, IMAGES_DIR, VIDEOS_DIR
 
-logger = structlog.get_logger(__name__)
+@lru_cache(maxsize=1)
+def _pil_image():
+    """PIL.Image module, or None when Pillow is not installed."""
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.warning("PIL not available, image validation will be limited")
+        return None
+    return Image
+
+
+@lru_cache(maxsize=1)
+def _google_transient_errors() -> tuple:
+    """Retryable google.api_core exception types (empty when the library is missing)."""
+    try:
+        from google.api_core import exceptions as google_exceptions
+    except ImportError:
+        return ()
+    return (
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.TooManyRequests,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.InternalServerError,
+    )
+
+# Cap concurrent Canva requests below the session's connector limit
+_CANVA_MAX_IN_FLIGHT = 16
+_CANVA_MAX_RETRIES = 2
+
+# Circuit breaker: after this many consecutive failed calls, skip the API for a cooldown
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_COOLDOWN_SECONDS = 30.0
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Whether an API error is worth retrying (timeouts, 5xx, 429, dropped connections)."""
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError) + _google_transient_errors()):
+        return True
+    aiohttp = _aiohttp()
+    if aiohttp is not None and isinstance(error, aiohttp.ClientError):
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status >= 500 or error.status == 429
+        return True
+    return False
+
+
+async def _retry(operation, attempts: int = 3, base: float = 0.5, event: str = "real_api_retry_scheduled"):
+    """
+    Await an API call, retrying transient failures with exponential backoff.
+    
+    Args:
+        operation: Zero-argument callable returning the call's awaitable
+        attempts: Total attempts including the first
+        base: Backoff base in seconds (doubled per attempt, plus jitter)
+        event: Log event emitted before each retry
+        
+    Returns:
+        Result of the operation
+    """
+    for attempt in range(attempts):
+        try:
+            return await operation()
+        except Exception as e:
+            if attempt >= attempts - 1 or not _is_transient_error(e):
+                raise
+            backoff_seconds = base * 2 ** attempt + random.random() * 0.1
+            logger.warning(event, error=str(e), next_attempt=attempt + 1, backoff_seconds=backoff_seconds)
+            await asyncio.sleep(backoff_seconds)
+
+
+class _CircuitBreaker:
+    """Routes calls to the mock path for a cooldown after repeated API failures."""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.failures = 0
+        self.open_until = 0.0
+    
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self.open_until
+    
+    def record_success(self) -> None:
+        self.failures = 0
+    
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= _BREAKER_FAILURE_THRESHOLD:
+            self.open_until = time.monotonic() + _BREAKER_COOLDOWN_SECONDS
+            self.failures = 0
+            logger.warning("circuit_breaker_opened", client=self.name, cooldown_seconds=_BREAKER_COOLDOWN_SECONDS)
+
+# Collision-free mock IDs, even for calls within the same second
+_ID_COUNTER = itertools.count()
+
+# Concurrent Imagen requests per batch (Vertex AI QPS quota)
+_IMAGEN_MAX_CONCURRENCY = 4
+
+# Reference images kept in memory per RealVeoClient (LRU)
+_VEO_REF_CACHE_SIZE = 8
+
+# Blocking Vertex SDK calls (generation, model loading) run here
+_VERTEX_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="vertex")
+
+# Image decoding for quality scoring runs here, not on the event loop
+_QUALITY_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="img-quality")
+
+
+# JPEG start-of-frame markers (baseline, progressive, lossless, ...); C4/C8/CC are not frames
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _peek_dimensions(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from PNG, JPEG or WebP header bytes without decoding.
+    
+    Args:
+        data: Encoded image bytes
+        
+    Returns:
+        (width, height), or None if the format is not recognized
+    """
+    try:
+        if data[:8] == b"\x89PNG\r\n\x1a\n":
+            return struct.unpack(">II", data[16:24])
+        
+        if data[:2] == b"\xff\xd8":
+            i = 2
+            while i + 9 <= len(data):
+                if data[i] != 0xFF:
+                    return None
+                marker = data[i + 1]
+                if marker == 0xFF:
+                    # Fill byte before the marker
+                    i += 1
+                elif marker in _JPEG_SOF_MARKERS:
+                    height, width = struct.unpack(">HH", data[i + 5:i + 9])
+                    return width, height
+                elif marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                    # Standalone markers carry no length field
+                    i += 2
+                else:
+                    i += 2 + struct.unpack(">H", data[i + 2:i + 4])[0]
+            return None
+        
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            chunk = data[12:16]
+            if chunk == b"VP8 ":
+                width, height = struct.unpack("<HH", data[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b"VP8L":
+                bits = int.from_bytes(data[21:25], "little")
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b"VP8X":
+                return int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+    except (struct.error, IndexError):
+        return None
+    
+    return None
+
+
+@lru_cache(maxsize=1)
+def _use_mock_apis() -> bool:
+    """USE_MOCK_APIS toggle, read once per process."""
+    return os.getenv("USE_MOCK_APIS", "false").lower() == "true"
+
+
+@lru_cache(maxsize=1)
+def _vertex_context() -> Tuple[Optional[str], str, bool]:
+    """
+    Resolve Vertex AI settings and run vertexai.init() once per process.
+    
+    Returns:
+        (project_id, location, use_mock); use_mock is True when mocks are
+        requested, the SDK is missing, or initialization failed
+    """
+    project_id = os.getenv("GCP_PROJECT_ID")
+    location = os.getenv("VERTEX_AI_LOCATION", "us-central1")
+    
+    if _use_mock_apis() or _vision_models() is None:
+        return project_id, location, True
+    
+    try:
+        import vertexai
+        vertexai.init(project=project_id, location=location)
+    except Exception as e:
+        logger.warning("failed_to_initialize_vertex_ai", error=str(e), falling_back_to_mock=True)
+        return project_id, location, True
+    
+    return project_id, location, False
+
+
+@lru_cache(maxsize=1)
+def _imagen_model():
+    """Imagen model handle shared by all RealImagenClient instances."""
+    return _vision_models().ImageGenerationModel.from_pretrained("imagen-3.0-generate-001")
+
+
+@lru_cache(maxsize=1)
+def _canva_env() -> Tuple[Optional[str], str]:
+    """Canva API key and base URL, read once per process."""
+    return os.getenv("CANVA_API_KEY"), os.getenv("CANVA_API_URL", "https://api.canva.com/rest/v1")
+
+
+def _generated_image_bytes(image) -> bytes:
+    """Raw encoded bytes of a Vertex GeneratedImage, avoiding base64 where the SDK allows."""
+    image_data = getattr(image, "_image_bytes", None) or getattr(image, "data", None)
+    if image_data:
+        return image_data
+    
+    # Older SDKs only expose the base64 form
+    import base64
+    return base64.b64decode(image._as_base64_string())
+
+
+async def _read_file_bytes_async(path: str) -> bytes:
+    """Read a whole file without blocking the event loop."""
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(path, "rb") as f:
+            return await f.read()
+    return await asyncio.to_thread(Path(path).read_bytes)
+
+
+async def _write_file_bytes_async(path, data: bytes) -> None:
+    """Write a whole file without blocking the event loop."""
+    if AIOFILES_AVAILABLE:
+        async with aiofiles.open(path, "wb") as f:
+            await f.write(data)
+    else:
+        await asyncio.to_thread(Path(path).write_bytes, data)
 
 
 class RealImagenClient:
@@ -54,20 +293,17 @@ class RealImagenClient:
     """
     
     def __init__(self):
-        self.project_id = os.getenv("GCP_PROJECT_ID")
-        self.location = os.getenv("VERTEX_AI_LOCATION", "us-central1")
-        self.use_mock = os.getenv("USE_MOCK_APIS", "false").lower() == "true"
+        self.project_id, self.location, self.use_mock = _vertex_context()
+        self._breaker = _CircuitBreaker("imagen")
         
-        if not self.use_mock and VERTEX_AI_AVAILABLE:
+        if not self.use_mock:
             try:
-                vertexai.init(project=self.project_id, location=self.location)
-                self.model = ImageGenerationModel.from_pretrained("imagen-3.0-generate-001")
+                self.model = _imagen_model()
                 logger.info("real_imagen_initialized", project_id=self.project_id, location=self.location)
             except Exception as e:
                 logger.warning("failed_to_initialize_imagen", error=str(e), falling_back_to_mock=True)
                 self.use_mock = True
         else:
-            self.use_mock = True
             logger.info("using_mock_imagen", reason="USE_MOCK_APIS=true or vertexai not available")
     
     async def generate_image(
@@ -89,64 +325,145 @@ class RealImagenClient:
             refinement_iteration: Which refinement cycle this is
             
         Returns:
-            Dict with image_id, local_path, quality_score, image_data
+            Dict with image_id, local_path, quality_score (bytes stay on disk)
         """
         image_id = f"img_slide_{slide_number}"
         
-        if self.use_mock:
+        if self.use_mock or self._breaker.is_open:
             return await self._generate_mock_image(image_id, slide_number, prompt, refinement_iteration)
         
+        log = logger.bind(image_id=image_id, slide=slide_number, refinement=refinement_iteration)
+        
         try:
-            logger.info("real_imagen_api_call", prompt_preview=prompt[:50], slide=slide_number)
-            
-            # REAL VERTEX AI API CALL
-            response = self.model.generate_images(
-                prompt=prompt,
-                number_of_images=1,
-                aspect_ratio=aspect_ratio,
-                safety_filter_level="block_medium_and_above",
-                person_generation="allow_adult"
-            )
+            log.info("real_imagen_api_call", prompt_preview=prompt[:50])
+            
+            # REAL VERTEX AI API CALL (blocking SDK call, kept off the event loop)
+            loop = asyncio.get_running_loop()
+            response = await _retry(lambda: loop.run_in_executor(
+                _VERTEX_POOL,
+                partial(
+                    self.model.generate_images,
+                    prompt=prompt,
+                    number_of_images=1,
+                    aspect_ratio=aspect_ratio,
+                    safety_filter_level="block_medium_and_above",
+                    person_generation="allow_adult"
+                )
+            ))
+            self._breaker.record_success()
             
             # Get the generated image
             image = response.images[0]
             
-            # Convert to bytes
-            image_bytes = image._as_base64_string()
-            image_data = base64.b64decode(image_bytes)
-            
-            # Save to local storage
-            local_path = AssetPathManager.get_image_path(image_id, slide_number, refinement_iteration)
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(local_path, "wb") as f:
-                f.write(image_data)
+            # Raw bytes straight from the SDK, no base64 round-trip
+            image_data = _generated_image_bytes(image)
             
-            # Assess quality (simple heuristic based on file size and dimensions)
-            quality_score = self._assess_image_quality(image_data)
+            # Save to local storage; the write runs while quality is scored
+            local_path = get_image_path(image_id, slide_number, refinement_iteration)
+            path_str = str(local_path)
+            save_task = asyncio.ensure_future(_write_file_bytes_async(local_path, image_data))
             
-            logger.info(
+            try:
+                # Assess quality (simple heuristic based on file size and dimensions)
+                # Header sniffing is O(1); only unrecognized formats need PIL in the pool
+                dimensions = _peek_dimensions(image_data)
+                if dimensions is not None:
+                    quality_score = self._score_dimensions(len(image_data), *dimensions)
+                else:
+                    quality_score = await loop.run_in_executor(
+                        _QUALITY_POOL, self._assess_image_quality, image_data
+                    )
+            finally:
+                await save_task
+            
+            log.info(
                 "real_imagen_success",
-                image_id=image_id,
-                local_path=str(local_path),
+                local_path=path_str,
                 size_bytes=len(image_data),
                 quality_score=quality_score
             )
             
             return {
                 "image_id": image_id,
-                "local_path": str(local_path),
+                "local_path": path_str,
                 "quality_score": quality_score,
                 "generation_time_seconds": 2.0,  # Approximate
                 "prompt_used": prompt,
-                "refinement_iteration": refinement_iteration,
-                "image_data": image_data
+                "refinement_iteration": refinement_iteration
             }
             
         except Exception as e:
-            logger.error("real_imagen_failed", error=str(e), image_id=image_id)
+            self._breaker.record_failure()
+            log.error("real_imagen_failed", error=str(e))
             # Fall back to mock on error
             return await self._generate_mock_image(image_id, slide_number, prompt, refinement_iteration)
     
+    async def generate_images_batch(
+        self,
+        prompts: List[str],
+        slide_numbers: List[int],
+        aspect_ratio: str = "16:9",
+        quality: str = "high",
+        refinement_iteration: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate images for several slides concurrently.
+        
+        Identical prompts are generated once and the image is copied to the
+        other slides' paths.
+        
+        Args:
+            prompts: Text prompt per slide
+            slide_numbers: Slide number per prompt (same length as prompts)
+            aspect_ratio: Image aspect ratio
+            quality: Generation quality level
+            refinement_iteration: Which refinement cycle this is
+            
+        Returns:
+            generate_image results in input order; a slide whose generation
+            raised gets its exception instead of failing the whole batch
+        """
+        semaphore = asyncio.Semaphore(_IMAGEN_MAX_CONCURRENCY)
+        
+        async def _generate(prompt: str, slide_number: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_image(
+                    prompt, slide_number, aspect_ratio, quality, refinement_iteration
+                )
+        
+        # First slide for each distinct prompt does the API call
+        first_slide: Dict[str, int] = {}
+        for prompt, slide_number in zip(prompts, slide_numbers):
+            first_slide.setdefault(prompt, slide_number)
+        
+        unique_results = dict(zip(
+            first_slide,
+            await asyncio.gather(
+                *(_generate(p, n) for p, n in first_slide.items()),
+                return_exceptions=True
+            )
+        ))
+        
+        results = []
+        for prompt, slide_number in zip(prompts, slide_numbers):
+            result = unique_results[prompt]
+            if slide_number != first_slide[prompt] and not isinstance(result, BaseException):
+                image_id = f"img_slide_{slide_number}"
+                local_path = get_image_path(image_id, slide_number, refinement_iteration)
+                await asyncio.to_thread(shutil.copyfile, result["local_path"], local_path)
+                result = {**result, "image_id": image_id, "local_path": str(local_path)}
+            results.append(result)
+        
+        logger.info(
+            "imagen_batch_completed",
+            total=len(prompts),
+            api_calls=len(unique_results),
+            failed=sum(1 for r in results if isinstance(r, BaseException)),
+            refinement_iteration=refinement_iteration
+        )
+        
+        return results
+    
     async def _generate_mock_image(
         self,
         image_id: str,
@@ -155,23 +472,21 @@ class RealImagenClient:
         refinement_iteration: int
     ) -> Dict[str, Any]:
         """Generate mock image (same as before)."""
-        local_path = AssetPathManager.get_image_path(image_id, slide_number, refinement_iteration)
-        local_path.parent.mkdir(parents=True, exist_ok=True)
+        local_path = get_image_path(image_id, slide_number, refinement_iteration)
         
         # Create tiny placeholder
-        with open(local_path, "w") as f:
-            f.write("mock image data")
+        await _write_file_bytes_async(local_path, b"mock image data")
+        path_str = str(local_path)
         
-        logger.info("mock_image_generated", image_id=image_id, local_path=str(local_path))
+        logger.info("mock_image_generated", image_id=image_id, local_path=path_str)
         
         return {
             "image_id": image_id,
-            "local_path": str(local_path),
+            "local_path": path_str,
             "quality_score": 0.92,
             "generation_time_seconds": 0.001,
             "prompt_used": prompt,
-            "refinement_iteration": refinement_iteration,
-            "image_data": b"mock image data"
+            "refinement_iteration": refinement_iteration
         }
     
     def _assess_image_quality(self, image_data: bytes) -> float:
@@ -179,25 +494,34 @@ class RealImagenClient:
         Assess image quality based on size and dimensions.
         Returns score between 0 and 1.
         """
-        if not PIL_AVAILABLE:
+        dimensions = _peek_dimensions(image_data)
+        if dimensions is not None:
+            return self._score_dimensions(len(image_data), *dimensions)
+        
+        Image = _pil_image()
+        if Image is None:
             return 0.85  # Default quality score
         
         try:
             from io import BytesIO
             img = Image.open(BytesIO(image_data))
             width, height = img.size
-            
-            # Quality heuristics:
-            # - Larger images tend to be higher quality
-            # - Check if dimensions are reasonable
-            size_score = min(len(image_data) / (1024 * 1024), 1.0)  # Normalize by 1MB
-            dimension_score = min((width * height) / (1920 * 1080), 1.0)  # Normalize by 1080p
-            
-            quality = (size_score * 0.3 + dimension_score * 0.7)
-            return max(0.7, min(0.95, quality))  # Clamp between 0.7 and 0.95
+            return self._score_dimensions(len(image_data), width, height)
             
         except Exception:
             return 0.85
+    
+    @staticmethod
+    def _score_dimensions(size_bytes: int, width: int, height: int) -> float:
+        """Quality heuristic from encoded size and pixel dimensions."""
+        # Quality heuristics:
+        # - Larger images tend to be higher quality
+        # - Check if dimensions are reasonable
+        size_score = min(size_bytes / (1024 * 1024), 1.0)  # Normalize by 1MB
+        dimension_score = min((width * height) / (1920 * 1080), 1.0)  # Normalize by 1080p
+        
+        quality = (size_score * 0.3 + dimension_score * 0.7)
+        return max(0.7, min(0.95, quality))  # Clamp between 0.7 and 0.95
 
 
 class RealVeoClient:
@@ -207,20 +531,22 @@ class RealVeoClient:
     """
     
     def __init__(self):
-        self.project_id = os.getenv("GCP_PROJECT_ID")
-        self.location = os.getenv("VERTEX_AI_LOCATION", "us-central1")
-        self.use_mock = os.getenv("USE_MOCK_APIS", "false").lower() == "true"
+        self.project_id, self.location, self.use_mock = _vertex_context()
         
-        if not self.use_mock and VERTEX_AI_AVAILABLE:
-            try:
-                vertexai.init(project=self.project_id, location=self.location)
-                # Note: Veo might not be available in all regions yet
-                logger.info("real_veo_initialized", project_id=self.project_id, location=self.location)
-            except Exception as e:
-                logger.warning("failed_to_initialize_veo", error=str(e), falling_back_to_mock=True)
-                self.use_mock = True
-        else:
+        # Loaded once on first real generation, then reused
+        self._veo_model = None
+        self._ref_cache: "OrderedDict[Tuple[str, int], bytes]" = OrderedDict()
+        self._breaker = _CircuitBreaker("veo")
+        
+        # VideoGenerationModel may not be available yet in current SDK
+        if not self.use_mock and not hasattr(_vision_models(), "VideoGenerationModel"):
+            logger.info("Veo not available in current SDK, will use mock")
             self.use_mock = True
+        
+        if not self.use_mock:
+            # Note: Veo might not be available in all regions yet
+            logger.info("real_veo_initialized", project_id=self.project_id, location=self.location)
+        else:
             logger.info("using_mock_veo", reason="USE_MOCK_APIS=true or vertexai not available")
     
     async def generate_video(
@@ -242,66 +568,83 @@ class RealVeoClient:
             refinement_iteration: Which refinement cycle this is
             
         Returns:
-            Dict with video_id, local_path, quality_score, video_data
+            Dict with video_id, local_path, quality_score (bytes stay on disk)
         """
         video_id = "veo_trailer"
         
-        if self.use_mock or not source_images:
+        if self.use_mock or not source_images or self._breaker.is_open:
             return await self._generate_mock_video(video_id, prompt, duration_seconds, refinement_iteration)
         
+        log = logger.bind(video_id=video_id, refinement=refinement_iteration)
+        
         try:
-            logger.info("real_veo_api_call", prompt_preview=prompt[:50], source_image=source_images[0])
+            log.info("real_veo_api_call", prompt_preview=prompt[:50], source_image=source_images[0])
             
-            # Load reference image
-            with open(source_images[0], "rb") as f:
-                reference_image_bytes = f.read()
+            # Load reference image (cached while the file is unchanged)
+            reference_image_bytes = await self._reference_image_bytes(source_images[0])
             
             # REAL VERTEX AI VEO API CALL
             # Note: Veo API might have different syntax, check latest docs
-            model = VideoGenerationModel.from_pretrained("veo-001")
+            if self._veo_model is None:
+                self._veo_model = await asyncio.get_running_loop().run_in_executor(
+                    _VERTEX_POOL, _vision_models().VideoGenerationModel.from_pretrained, "veo-001"
+                )
             
-            response = await model.generate_video_async(
+            response = await _retry(lambda: self._veo_model.generate_video_async(
                 prompt=prompt,
                 reference_image=reference_image_bytes,
                 duration_seconds=duration_seconds
-            )
-            
-            # Get video bytes
-            video_data = response.video
+            ))
+            self._breaker.record_success()
             
-            # Save to local storage
-            local_path = AssetPathManager.get_video_path(video_id, refinement_iteration)
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(local_path, "wb") as f:
-                f.write(video_data)
+            # Save to local storage; the bytes are not kept once on disk
+            local_path = get_video_path(video_id, refinement_iteration)
+            path_str = str(local_path)
+            await _write_file_bytes_async(local_path, response.video)
+            del response
             
-            quality_score = self._assess_video_quality(video_data, duration_seconds)
+            quality_score = self._assess_video_quality(local_path, duration_seconds)
             
-            logger.info(
+            log.info(
                 "real_veo_success",
-                video_id=video_id,
-                local_path=str(local_path),
-                size_bytes=len(video_data),
+                local_path=path_str,
+                size_bytes=os.path.getsize(local_path),
                 duration_seconds=duration_seconds,
                 quality_score=quality_score
             )
             
             return {
                 "video_id": video_id,
-                "local_path": str(local_path),
+                "local_path": path_str,
                 "duration_seconds": duration_seconds,
                 "quality_score": quality_score,
                 "generation_time_seconds": 45.0,  # Approximate
                 "prompt_used": prompt,
-                "source_images": source_images,
-                "video_data": video_data
+                "source_images": source_images
             }
             
         except Exception as e:
-            logger.error("real_veo_failed", error=str(e), video_id=video_id)
+            self._breaker.record_failure()
+            log.error("real_veo_failed", error=str(e))
             # Fall back to mock on error
             return await self._generate_mock_video(video_id, prompt, duration_seconds, refinement_iteration)
     
+    async def _reference_image_bytes(self, image_path: str) -> bytes:
+        """Read a reference image, reusing bytes for the same path and mtime."""
+        key = (image_path, os.stat(image_path).st_mtime_ns)
+        
+        cached = self._ref_cache.get(key)
+        if cached is not None:
+            self._ref_cache.move_to_end(key)
+            return cached
+        
+        image_bytes = await _read_file_bytes_async(image_path)
+        self._ref_cache[key] = image_bytes
+        if len(self._ref_cache) > _VEO_REF_CACHE_SIZE:
+            self._ref_cache.popitem(last=False)
+        
+        return image_bytes
+    
     async def _generate_mock_video(
         self,
         video_id: str,
@@ -310,31 +653,29 @@ class RealVeoClient:
         refinement_iteration: int
     ) -> Dict[str, Any]:
         """Generate mock video (same as before)."""
-        local_path = AssetPathManager.get_video_path(video_id, refinement_iteration)
-        local_path.parent.mkdir(parents=True, exist_ok=True)
+        local_path = get_video_path(video_id, refinement_iteration)
         
         # Create minimal MP4
-        with open(local_path, "w") as f:
-            f.write("mock video data")
+        await _write_file_bytes_async(local_path, b"mock video data")
+        path_str = str(local_path)
         
-        logger.info("mock_video_generated", video_id=video_id, local_path=str(local_path))
+        logger.info("mock_video_generated", video_id=video_id, local_path=path_str)
         
         return {
             "video_id": video_id,
-            "local_path": str(local_path),
+            "local_path": path_str,
             "duration_seconds": duration_seconds,
             "quality_score": 0.91,
             "generation_time_seconds": 0.001,
             "prompt_used": prompt,
-            "source_images": [],
-            "video_data": b"mock video data"
+            "source_images": []
         }
     
-    def _assess_video_quality(self, video_data: bytes, expected_duration: int) -> float:
-        """Assess video quality based on size and expected duration."""
+    def _assess_video_quality(self, local_path, expected_duration: int) -> float:
+        """Assess video quality based on on-disk size and expected duration."""
         # Heuristic: ~1MB per second of video is reasonable
         expected_size = expected_duration * 1024 * 1024
-        actual_size = len(video_data)
+        actual_size = os.path.getsize(local_path)
         
         size_ratio = min(actual_size / expected_size, 1.5)  # Cap at 1.5x
         quality = min(0.95, 0.7 + (size_ratio * 0.2))
@@ -349,168 +690,312 @@ class RealCanvaConnectClient:
     """
     
     def __init__(self):
-        self.api_key = os.getenv("CANVA_API_KEY")
-        self.api_url = os.getenv("CANVA_API_URL", "https://api.canva.com/rest/v1")
-        self.use_mock = os.getenv("USE_MOCK_APIS", "false").lower() == "true"
+        self.api_key, self.api_url = _canva_env()
+        self.use_mock = _use_mock_apis()
+        
+        # Shared keep-alive session, created lazily on first real API call
+        self._session = None
+        self._session_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(_CANVA_MAX_IN_FLIGHT)
+        self._breaker = _CircuitBreaker("canva")
         
-        if not self.use_mock and self.api_key and AIOHTTP_AVAILABLE:
+        # Successful responses by request identity; failures are never cached
+        self._deck_cache: Dict[str, Dict[str, str]] = {}
+        self._page_cache: Dict[Tuple[str, int, Optional[str]], Dict[str, str]] = {}
+        self._asset_cache: Dict[str, str] = {}
+        self._key_locks: Dict[Any, asyncio.Lock] = {}
+        
+        if not self.use_mock and self.api_key and _aiohttp() is not None:
             logger.info("real_canva_initialized", api_url=self.api_url)
         else:
             self.use_mock = True
             reason = "USE_MOCK_APIS=true" if self.use_mock else ("no API key" if not self.api_key else "aiohttp not available")
             logger.info("using_mock_canva", reason=reason)
     
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the shared authenticated Canva session, creating it on first use."""
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                aiohttp = _aiohttp()
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+                    timeout=aiohttp.ClientTimeout(total=30),
+                    headers={"Authorization": f"Bearer {self.api_key}"}
+                )
+            return self._session
+    
+    async def close(self) -> None:
+        """Close the shared Canva HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _key_lock(self, key: Any) -> asyncio.Lock:
+        """Lock that coalesces concurrent identical requests into one in-flight call."""
+        lock = self._key_locks.get(key)
+        if lock is None:
+            lock = self._key_locks[key] = asyncio.Lock()
+        return lock
+    
+    async def _with_backoff(self, operation, max_retries: int = _CANVA_MAX_RETRIES):
+        """
+        Run a Canva request under the in-flight cap, retrying transient failures.
+        
+        Args:
+            operation: Zero-argument callable returning the request coroutine
+            max_retries: Maximum retries after the first attempt
+            
+        Returns:
+            Result of the operation
+        """
+        async def _limited():
+            # Slot is released between attempts so backoff sleeps don't hold it
+            async with self._request_semaphore:
+                return await operation()
+        
+        return await _retry(_limited, attempts=max_retries + 1, event="real_canva_retry_scheduled")
+    
     async def create_deck(self, title: str) -> Dict[str, str]:
         """Create a new Canva deck."""
-        if self.use_mock:
+        if self.use_mock or self._breaker.is_open:
             return await self._create_mock_deck(title)
         
-        try:
-            import aiohttp
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+        log = logger.bind(title=title)
+        
+        async with self._key_lock(("deck", title)):
+            cached = self._deck_cache.get(title)
+            if cached is not None:
+                return dict(cached)
             
-            payload = {
-                "asset_type": "presentation",
-                "name": title
-            }
+            try:
+                payload = {
+                    "asset_type": "presentation",
+                    "name": title
+                }
+                
+                log.info("real_canva_api_call_create_deck")
+                
+                session = await self._get_session()
+                
+                async def _post_design():
+                    async with session.post(f"{self.api_url}/designs", json=payload) as response:
+                        response.raise_for_status()
+                        if response.status != 200:
+                            raise Exception(f"Canva API error: {response.status}")
+                        return await response.json()
+                
+                data = await self._with_backoff(_post_design)
+                self._breaker.record_success()
+                deck_id = data["design"]["id"]
+                deck_url = data["design"]["urls"]["edit_url"]
+                
+                log.info("real_canva_deck_created", deck_id=deck_id, deck_url=deck_url)
+                
+                result = {
+                    "deck_id": deck_id,
+                    "deck_url": deck_url
+                }
+                self._deck_cache[title] = result
+                return dict(result)
             
-            logger.info("real_canva_api_call_create_deck", title=title)
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/designs",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status != 200:
-                        raise Exception(f"Canva API error: {response.status}")
-                    
-                    data = await response.json()
-                    deck_id = data["design"]["id"]
-                    deck_url = data["design"]["urls"]["edit_url"]
-                    
-                    logger.info("real_canva_deck_created", deck_id=deck_id, deck_url=deck_url)
-                    
-                    return {
-                        "deck_id": deck_id,
-                        "deck_url": deck_url
-                    }
-        
-        except Exception as e:
-            logger.error("real_canva_failed", error=str(e))
-            return await self._create_mock_deck(title)
+            except Exception as e:
+                self._breaker.record_failure()
+                log.error("real_canva_failed", error=str(e))
+                return await self._create_mock_deck(title)
     
     async def add_page(self, deck_id: str, position: int, title: str = None) -> Dict[str, str]:
         """Add a page to the deck."""
-        if self.use_mock:
+        if self.use_mock or self._breaker.is_open:
             return await self._add_mock_page(deck_id, position, title)
         
         try:
-            import aiohttp
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+            result = await self._create_page(deck_id, position, title)
+            self._breaker.record_success()
+            return result
+        
+        except Exception as e:
+            self._breaker.record_failure()
+            logger.error("real_canva_add_page_failed", error=str(e), deck_id=deck_id, position=position)
+            return await self._add_mock_page(deck_id, position, title)
+    
+    async def _create_page(self, deck_id: str, position: int, title: Optional[str]) -> Dict[str, str]:
+        """Create a page via the API (cached by identity); raises on failure."""
+        key = (deck_id, position, title)
+        async with self._key_lock(("page",) + key):
+            cached = self._page_cache.get(key)
+            if cached is not None:
+                return dict(cached)
             
             payload = {"position": position}
             if title:
                 payload["title"] = title
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/designs/{deck_id}/pages",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    data = await response.json()
-                    return {
-                        "page_id": data["page"]["id"],
-                        "deck_id": deck_id
-                    }
-        
-        except Exception as e:
-            logger.error("real_canva_add_page_failed", error=str(e))
-            return await self._add_mock_page(deck_id, position, title)
+            session = await self._get_session()
+            
+            async def _post_page():
+                async with session.post(f"{self.api_url}/designs/{deck_id}/pages", json=payload) as response:
+                    response.raise_for_status()
+                    return await response.json()
+            
+            data = await self._with_backoff(_post_page)
+            result = {
+                "page_id": data["page"]["id"],
+                "deck_id": deck_id
+            }
+            self._page_cache[key] = result
+            return dict(result)
     
     async def place_image(self, deck_id: str, page_id: str, image_path: str, position: str = "center") -> Dict[str, Any]:
         """Upload and place an image on a slide."""
-        if self.use_mock:
+        if self.use_mock or self._breaker.is_open:
             return await self._place_mock_image(deck_id, page_id, image_path, position)
         
         try:
             # 1. Upload image as asset
-            asset_id = await self._upload_image_asset(image_path)
+            asset_id = await self._with_backoff(lambda: self._upload_image_asset(image_path))
             
             # 2. Add element to page
-            await self._add_element_to_page(deck_id, page_id, asset_id, position)
+            await self._with_backoff(lambda: self._add_element_to_page(deck_id, page_id, asset_id, position))
+            self._breaker.record_success()
             
             return {"deck_id": deck_id, "page_id": page_id, "asset_id": asset_id}
         
         except Exception as e:
+            self._breaker.record_failure()
             logger.error("real_canva_place_image_failed", error=str(e))
             return await self._place_mock_image(deck_id, page_id, image_path, position)
     
+    async def create_slide_with_image(
+        self,
+        deck_id: str,
+        position: int,
+        image_path: str,
+        title: Optional[str] = None,
+        image_position: str = "center"
+    ) -> Dict[str, Any]:
+        """
+        Create a page and place an image on it in two round-trips instead of three.
+        
+        The asset upload and page creation don't depend on each other, so they run
+        concurrently on the shared session; only the element add waits for both.
+        
+        Args:
+            deck_id: ID of the deck
+            position: Page position in the deck
+            image_path: Local path of the image to upload
+            title: Optional page title
+            image_position: Position of the image on the page
+            
+        Returns:
+            Dict with deck_id, page_id and (for real API calls) asset_id
+        """
+        if self.use_mock or self._breaker.is_open:
+            return await self._create_mock_slide(deck_id, position, image_path, title, image_position)
+        
+        try:
+            asset_id, page = await asyncio.gather(
+                self._with_backoff(lambda: self._upload_image_asset(image_path)),
+                self._create_page(deck_id, position, title)
+            )
+            page_id = page["page_id"]
+            
+            await self._with_backoff(lambda: self._add_element_to_page(deck_id, page_id, asset_id, image_position))
+            self._breaker.record_success()
+            
+            return {"deck_id": deck_id, "page_id": page_id, "asset_id": asset_id}
+        
+        except Exception as e:
+            self._breaker.record_failure()
+            logger.error("real_canva_create_slide_failed", error=str(e), position=position)
+            return await self._create_mock_slide(deck_id, position, image_path, title, image_position)
+    
+    async def create_slides_bulk(
+        self,
+        deck_id: str,
+        slide_specs: List[Tuple[int, str, Optional[str]]],
+        image_position: str = "center"
+    ) -> List[Any]:
+        """
+        Create several image slides concurrently.
+        
+        Args:
+            deck_id: ID of the deck
+            slide_specs: (position, image_path, title) triples, one per slide
+            image_position: Position of each image on its page
+            
+        Returns:
+            create_slide_with_image results in slide_specs order; a failure is returned as its exception
+        """
+        return await asyncio.gather(
+            *(
+                self.create_slide_with_image(deck_id, position, image_path, title, image_position)
+                for position, image_path, title in slide_specs
+            ),
+            return_exceptions=True
+        )
+    
     async def _upload_image_asset(self, image_path: str) -> str:
         """Upload image to Canva."""
-        import aiohttp
+        session = await self._get_session()
         
-        headers = {"Authorization": f"Bearer {self.api_key}"}
+        # Read off the event loop; a blocking file object would stall it on every chunk
+        image_bytes = await _read_file_bytes_async(image_path)
         
-        with open(image_path, "rb") as f:
+        # Identical image bytes are uploaded once per client
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        async with self._key_lock(("asset", digest)):
+            cached = self._asset_cache.get(digest)
+            if cached is not None:
+                return cached
+            
+            aiohttp = _aiohttp()
             data = aiohttp.FormData()
-            data.add_field("file", f, filename=os.path.basename(image_path))
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/assets/upload",
-                    headers=headers,
-                    data=data,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    result = await response.json()
-                    return result["asset"]["id"]
+            data.add_field("file", image_bytes, filename=os.path.basename(image_path), content_type="image/png")
+            
+            async with session.post(
+                f"{self.api_url}/assets/upload",
+                data=data,
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
+                asset_id = result["asset"]["id"]
+            
+            self._asset_cache[digest] = asset_id
+            return asset_id
     
     async def _add_element_to_page(self, deck_id: str, page_id: str, asset_id: str, position: str):
         """Add asset element to page."""
-        import aiohttp
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "type": "image",
             "asset_id": asset_id,
             "position": position
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.api_url}/designs/{deck_id}/pages/{page_id}/elements",
-                headers=headers,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                return await response.json()
+        session = await self._get_session()
+        async with session.post(
+            f"{self.api_url}/designs/{deck_id}/pages/{page_id}/elements",
+            json=payload
+        ) as response:
+            response.raise_for_status()
+            return await response.json()
     
     # Mock fallbacks
     async def _create_mock_deck(self, title: str) -> Dict[str, str]:
-        deck_id = f"canva_design_{int(datetime.now().timestamp())}"
+        deck_id = f"canva_design_{next(_ID_COUNTER)}_{time.monotonic_ns()}"
         logger.info("mock_canva_deck_created", deck_id=deck_id)
         return {"deck_id": deck_id, "deck_url": None}
     
     async def _add_mock_page(self, deck_id: str, position: int, title: str) -> Dict[str, str]:
-        page_id = f"page_{int(datetime.now().timestamp())}"
+        page_id = f"page_{next(_ID_COUNTER)}_{time.monotonic_ns()}"
         return {"page_id": page_id, "deck_id": deck_id}
     
     async def _place_mock_image(self, deck_id: str, page_id: str, image_path: str, position: str) -> Dict[str, Any]:
         return {"deck_id": deck_id, "page_id": page_id, "position": position}
+    
+    async def _create_mock_slide(
+        self, deck_id: str, position: int, image_path: str, title: Optional[str], image_position: str
+    ) -> Dict[str, Any]:
+        page = await self._add_mock_page(deck_id, position, title)
+        return await self._place_mock_image(deck_id, page["page_id"], image_path, image_position)
 
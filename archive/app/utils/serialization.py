@@ -0,0 +1,106 @@
+"""
+GTMForge JSON Serialization
+Canonical JSON codec for pipeline state, stage outputs, and log payloads.
+Uses orjson when installed and falls back to the stdlib json module.
+"""
+
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Convert pydantic models to JSON-compatible Python objects."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    return obj
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize a pydantic model or plain object to JSON bytes.
+
+    Args:
+        obj: Pydantic model, dict, list or scalar to serialize
+        indent: Whether to pretty-print with 2-space indentation
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    data = _to_jsonable(obj)
+
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+
+    return json.dumps(data, indent=2 if indent else None, default=str).encode("utf-8")
+
+
+def dumps_str(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize a pydantic model or plain object to a JSON string.
+
+    Args:
+        obj: Pydantic model, dict, list or scalar to serialize
+        indent: Whether to pretty-print with 2-space indentation
+
+    Returns:
+        JSON string (for text-only sinks such as WebSocket send_text)
+    """
+    return dumps(obj, indent=indent).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize JSON bytes or string.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Decoded Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def log_serializer(obj: Any, **kwargs) -> str:
+    """
+    Serializer for structlog's JSONRenderer.
+
+    Args:
+        obj: Event dictionary produced by the processor chain
+        **kwargs: Keyword arguments passed by JSONRenderer (e.g. default)
+
+    Returns:
+        JSON string for the log line
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=kwargs.get("default", str)).decode("utf-8")
+    return json.dumps(obj, **kwargs)
+
+
+def log_serializer_bytes(obj: Any, **kwargs) -> bytes:
+    """
+    Bytes serializer for structlog's JSONRenderer paired with BytesLoggerFactory.
+
+    Args:
+        obj: Event dictionary produced by the processor chain
+        **kwargs: Keyword arguments passed by JSONRenderer (e.g. default)
+
+    Returns:
+        UTF-8 encoded JSON bytes for the log line
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=kwargs.get("default", str))
+    return json.dumps(obj, **kwargs).encode("utf-8")
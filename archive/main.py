@@ -5,17 +5,29 @@ CLI interface for testing the Phase 1 pipeline.
 """
 
 import asyncio
+import os
 import sys
-import json
 from typing import Optional
 
-from app import GTMForgeOrchestrator, StartupIdeaInput, configure_logging, get_logger
-from app.utils.config import get_config
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError
 
+from app import GTMForgeOrchestrator, PipelineState, StartupIdeaInput
+from app.utils.logger import configure_logging, get_logger
+from app.utils.serialization import dumps
 
-def print_banner():
-    """Print GTMForge banner."""
-    banner = """
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # Not installed, or unsupported platform (Windows)
+    UVLOOP_AVAILABLE = False
+
+# structlog resolves its configuration lazily on first use, so this picks up
+# the configure_logging() call made in main()
+logger = get_logger(__name__)
+
+_BANNER = """
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
     ║   ██████╗ ████████╗███╗   ███╗███████╗ ██████╗ ██████╗    ║
@@ -30,14 +42,195 @@ def print_banner():
     ║                                                           ║
     ╚═══════════════════════════════════════════════════════════╝
     """
-    print(banner)
+
+_BAR = "=" * 60
+
+
+def print_banner():
+    """Print GTMForge banner."""
+    print(_BANNER)
+
+
+def format_section(title: str) -> str:
+    """Format a section header."""
+    return f"\n{_BAR}\n  {title}\n{_BAR}\n\n"
 
 
 def print_section(title: str):
     """Print a section header."""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print(f"{'='*60}\n")
+    sys.stdout.write(format_section(title))
+
+
+def _write_stdout(text: str) -> None:
+    """Emit a fully formatted report block with one write and one flush."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def format_input(startup_input: StartupIdeaInput) -> str:
+    """Format the Input Validation section."""
+    lines = [f"Idea: {startup_input.idea}"]
+    if startup_input.industry:
+        lines.append(f"Industry: {startup_input.industry}")
+    if startup_input.target_market:
+        lines.append(f"Target Market: {startup_input.target_market}")
+    return format_section("Input Validation") + "\n".join(lines) + "\n"
+
+
+def _format_stage(title: str, details: list) -> str:
+    """Format one stage entry of the Pipeline Results section."""
+    return f"\n  {title}\n" + "".join(f"     - {detail}\n" for detail in details)
+
+
+def format_results(pipeline_state: PipelineState) -> str:
+    """
+    Format the Pipeline Results section, skipping stages without output.
+    
+    Args:
+        pipeline_state: Completed pipeline state
+        
+    Returns:
+        The whole section as one string
+    """
+    duration = (pipeline_state.completed_at - pipeline_state.started_at).total_seconds()
+    parts = [
+        format_section("Pipeline Results"),
+        f"✓ Session ID: {pipeline_state.session_id}\n",
+        f"✓ Status: {pipeline_state.current_stage}\n",
+        f"✓ Duration: {duration:.2f}s\n",
+        "\nStage Outputs:\n",
+    ]
+    
+    ideation = pipeline_state.ideation_output
+    if ideation:
+        parts.append(_format_stage("1. Ideation Agent", [
+            f"ICPs identified: {len(ideation.icps)}",
+            f"Pain points: {len(ideation.key_pain_points)}",
+            f"Differentiators: {len(ideation.unique_differentiators)}",
+        ]))
+    
+    comparative = pipeline_state.comparative_output
+    if comparative:
+        parts.append(_format_stage("2. Comparative Insight Agent", [
+            f"Benchmark companies: {len(comparative.benchmark_companies)}",
+            f"GTM strategies: {len(comparative.gtm_strategies)}",
+            f"Investor appeal factors: {len(comparative.investor_appeal_factors)}",
+        ]))
+    
+    pitch = pipeline_state.pitch_output
+    if pitch:
+        parts.append(_format_stage("3. Pitch Writer Agent", [
+            f"Deck title: {pitch.deck_title}",
+            f"Total slides: {len(pitch.slides)}",
+            f"Duration: {pitch.estimated_pitch_duration} minutes",
+        ]))
+    
+    prompts = pipeline_state.prompt_output
+    if prompts:
+        parts.append(_format_stage("4. Prompt Forge Agent", [
+            f"Image prompts: {len(prompts.image_prompts)}",
+            f"Video prompts: {len(prompts.video_prompts)}",
+            f"Refinement cycles: {prompts.total_refinement_cycles}",
+        ]))
+    
+    qa = pipeline_state.qa_output
+    if qa:
+        parts.append(_format_stage("5. QA Agent", [
+            f"Validation passed: {'✓' if qa.validation_passed else '✗'}",
+            f"Content quality: {qa.content_quality_score:.1f}/100",
+            f"Brand consistency: {qa.brand_consistency_score:.1f}/100",
+            f"Issues found: {len(qa.issues)}",
+        ]))
+    
+    publisher = pipeline_state.publisher_output
+    if publisher:
+        parts.append(_format_stage("6. Publisher Agent", [
+            f"Manifest ID: {publisher.manifest_id}",
+            f"Status: {publisher.status}",
+            "Note: Phase 3 feature (mock output)",
+        ]))
+    
+    return "".join(parts)
+
+
+_SUCCESS_TEXT = format_section("Success") + """Pipeline completed successfully!
+
+Next Steps:
+  • Phase 2: Integrate Gemini 2.0 for actual content generation
+  • Phase 2: Connect Imagen and Veo for media assets
+  • Phase 2: Implement MCP integrations for real data
+  • Phase 3: Add publisher with GCS and Canva integration
+"""
+
+
+def _dump_section(value) -> bytes:
+    """Encode one output section; models go through pydantic-core straight to bytes."""
+    if isinstance(value, BaseModel):
+        return type(value).__pydantic_serializer__.to_json(value, indent=2)
+    return dumps(value, indent=True)
+
+
+def _write_all(fd: int, chunks: list) -> None:
+    """Write every chunk to fd, gathering them into one writev call where available."""
+    if not hasattr(os, "writev"):
+        # No writev on Windows; fall back to a single joined buffer
+        chunks = [b"".join(chunks)]
+    pending = [memoryview(chunk) for chunk in chunks]
+    while pending:
+        if len(pending) > 1:
+            written = os.writev(fd, pending)
+        else:
+            written = os.write(fd, pending[0])
+        # Short writes are rare on regular files; skip what landed and retry the rest
+        while pending and written >= len(pending[0]):
+            written -= len(pending.pop(0))
+        if written:
+            pending[0] = pending[0][written:]
+
+
+def write_output(output_file: str, startup_input: StartupIdeaInput, pipeline_state: PipelineState) -> None:
+    """
+    Write the pipeline results to a JSON file with a single gather write.
+    
+    Each stage output is encoded to its own bytes chunk and the chunks are
+    handed to os.writev together, so the document is never joined into one
+    buffer and never goes through the io module's buffering layers.
+    
+    Args:
+        output_file: Path to write the JSON document to
+        startup_input: Validated input the pipeline ran with
+        pipeline_state: Completed pipeline state
+    """
+    completed_at = pipeline_state.completed_at
+    sections = (
+        ("session_id", pipeline_state.session_id),
+        ("input", startup_input),
+        ("ideation", pipeline_state.ideation_output),
+        ("comparative", pipeline_state.comparative_output),
+        ("pitch", pipeline_state.pitch_output),
+        ("prompts", pipeline_state.prompt_output),
+        ("qa", pipeline_state.qa_output),
+        ("publisher", pipeline_state.publisher_output),
+        ("metadata", {
+            "started_at": pipeline_state.started_at.isoformat(),
+            "completed_at": completed_at.isoformat() if completed_at else None,
+            "duration_seconds": (completed_at - pipeline_state.started_at).total_seconds() if completed_at else None
+        }),
+    )
+    
+    chunks = []
+    separator = b"{\n"
+    for key, value in sections:
+        chunks.append(separator + dumps(key) + b": ")
+        chunks.append(_dump_section(value))
+        separator = b",\n"
+    chunks.append(b"\n}\n")
+    
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _write_all(fd, chunks)
+    finally:
+        os.close(fd)
 
 
 async def run_pipeline(
@@ -57,10 +250,13 @@ async def run_pipeline(
         additional_context: Additional context (optional)
         output_file: Path to save output JSON (optional)
     """
-    logger = get_logger(__name__)
+    # Run tasks eagerly (Python 3.12+): mock stages that finish without
+    # suspending complete inline instead of waiting for a loop iteration
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
     
     print_banner()
-    print_section("Input Validation")
     
     # Create input
     startup_input = StartupIdeaInput(
@@ -70,17 +266,14 @@ async def run_pipeline(
         additional_context=additional_context
     )
     
-    print(f"Idea: {startup_input.idea}")
-    if startup_input.industry:
-        print(f"Industry: {startup_input.industry}")
-    if startup_input.target_market:
-        print(f"Target Market: {startup_input.target_market}")
+    # Initialize orchestrator; MCP connection setup overlaps with the report I/O below
+    orchestrator = GTMForgeOrchestrator()
+    init_task = asyncio.create_task(orchestrator.initialize())
     
-    print_section("Initializing GTMForge")
+    _write_stdout(format_input(startup_input))
     
-    # Initialize orchestrator
-    orchestrator = GTMForgeOrchestrator()
-    await orchestrator.initialize()
+    print_section("Initializing GTMForge")
+    await init_task
     
     print("✓ Orchestrator initialized")
     print("✓ All agents loaded")
@@ -100,84 +293,28 @@ async def run_pipeline(
         print("Starting pipeline execution...\n")
         pipeline_state = await orchestrator.run_pipeline(startup_input)
         
-        print_section("Pipeline Results")
-        
-        # Display results
-        print(f"✓ Session ID: {pipeline_state.session_id}")
-        print(f"✓ Status: {pipeline_state.current_stage}")
-        print(f"✓ Duration: {(pipeline_state.completed_at - pipeline_state.started_at).total_seconds():.2f}s")
-        
-        # Stage results
-        print("\nStage Outputs:")
-        
-        if pipeline_state.ideation_output:
-            print(f"\n  1. Ideation Agent")
-            print(f"     - ICPs identified: {len(pipeline_state.ideation_output.icps)}")
-            print(f"     - Pain points: {len(pipeline_state.ideation_output.key_pain_points)}")
-            print(f"     - Differentiators: {len(pipeline_state.ideation_output.unique_differentiators)}")
-        
-        if pipeline_state.comparative_output:
-            print(f"\n  2. Comparative Insight Agent")
-            print(f"     - Benchmark companies: {len(pipeline_state.comparative_output.benchmark_companies)}")
-            print(f"     - GTM strategies: {len(pipeline_state.comparative_output.gtm_strategies)}")
-            print(f"     - Investor appeal factors: {len(pipeline_state.comparative_output.investor_appeal_factors)}")
-        
-        if pipeline_state.pitch_output:
-            print(f"\n  3. Pitch Writer Agent")
-            print(f"     - Deck title: {pipeline_state.pitch_output.deck_title}")
-            print(f"     - Total slides: {len(pipeline_state.pitch_output.slides)}")
-            print(f"     - Duration: {pipeline_state.pitch_output.estimated_pitch_duration} minutes")
-        
-        if pipeline_state.prompt_output:
-            print(f"\n  4. Prompt Forge Agent")
-            print(f"     - Image prompts: {len(pipeline_state.prompt_output.image_prompts)}")
-            print(f"     - Video prompts: {len(pipeline_state.prompt_output.video_prompts)}")
-            print(f"     - Refinement cycles: {pipeline_state.prompt_output.total_refinement_cycles}")
-        
-        if pipeline_state.qa_output:
-            print(f"\n  5. QA Agent")
-            print(f"     - Validation passed: {'✓' if pipeline_state.qa_output.validation_passed else '✗'}")
-            print(f"     - Content quality: {pipeline_state.qa_output.content_quality_score:.1f}/100")
-            print(f"     - Brand consistency: {pipeline_state.qa_output.brand_consistency_score:.1f}/100")
-            print(f"     - Issues found: {len(pipeline_state.qa_output.issues)}")
+        # Encode and write the output on a worker thread so the disk I/O
+        # overlaps with printing the results below
+        write_task = None
+        if output_file:
+            write_task = asyncio.create_task(
+                asyncio.to_thread(write_output, output_file, startup_input, pipeline_state)
+            )
         
-        if pipeline_state.publisher_output:
-            print(f"\n  6. Publisher Agent")
-            print(f"     - Manifest ID: {pipeline_state.publisher_output.manifest_id}")
-            print(f"     - Status: {pipeline_state.publisher_output.status}")
-            print(f"     - Note: Phase 3 feature (mock output)")
+        _write_stdout(format_results(pipeline_state))
         
         # Save output if requested
-        if output_file:
+        if write_task is not None:
             print_section("Saving Output")
-            output_data = {
-                "session_id": pipeline_state.session_id,
-                "input": startup_input.model_dump(),
-                "ideation": pipeline_state.ideation_output.model_dump() if pipeline_state.ideation_output else None,
-                "comparative": pipeline_state.comparative_output.model_dump() if pipeline_state.comparative_output else None,
-                "pitch": pipeline_state.pitch_output.model_dump() if pipeline_state.pitch_output else None,
-                "prompts": pipeline_state.prompt_output.model_dump() if pipeline_state.prompt_output else None,
-                "qa": pipeline_state.qa_output.model_dump() if pipeline_state.qa_output else None,
-                "publisher": pipeline_state.publisher_output.model_dump() if pipeline_state.publisher_output else None,
-                "metadata": {
-                    "started_at": pipeline_state.started_at.isoformat(),
-                    "completed_at": pipeline_state.completed_at.isoformat() if pipeline_state.completed_at else None,
-                    "duration_seconds": (pipeline_state.completed_at - pipeline_state.started_at).total_seconds() if pipeline_state.completed_at else None
-                }
-            }
-            
-            with open(output_file, 'w') as f:
-                json.dump(output_data, f, indent=2, default=str)
-            
+            try:
+                await write_task
+            except (OSError, TypeError, ValueError, PydanticSerializationError) as e:
+                print(f"✗ Failed to save output: {e}")
+                logger.exception("output_write_failed", output_file=output_file)
+                sys.exit(1)
             print(f"✓ Output saved to: {output_file}")
         
-        print_section("Success")
-        print("Pipeline completed successfully!")
-        print("\nNext Steps:")
-        print("  • Phase 2: Integrate Gemini 2.0 for actual content generation")
-        print("  • Phase 2: Connect Imagen and Veo for media assets")
-        print("  • Phase 2: Implement MCP integrations for real data")
-        print("  • Phase 3: Add publisher with GCS and Canva integration")
+        _write_stdout(_SUCCESS_TEXT)
         
     except Exception as e:
         print_section("Error")
@@ -252,14 +389,18 @@ Examples:
     # Configure logging
     configure_logging(log_level=args.log_level, json_format=False)
     
-    # Run pipeline
-    asyncio.run(run_pipeline(
+    # Run pipeline (on uvloop when available; the stdlib loop otherwise)
+    pipeline = run_pipeline(
         idea=args.idea,
         industry=args.industry,
         target_market=args.target_market,
         additional_context=args.context,
         output_file=args.output
-    ))
+    )
+    if UVLOOP_AVAILABLE:
+        uvloop.run(pipeline)
+    else:
+        asyncio.run(pipeline)
 
 
 if __name__ == "__main__":
@@ -38,6 +38,9 @@ export default function ProgressView({ taskId, onComplete, onError }: ProgressVi
     const wsUrl = `${protocol}//localhost:8000/ws/progress/${taskId}`
 
     const ws = new WebSocket(wsUrl)
+    // Progress frames are sent as binary JSON
+    ws.binaryType = 'arraybuffer'
+    const decoder = new TextDecoder()
 
     ws.onopen = () => {
       console.log('WebSocket connected')
@@ -46,21 +49,25 @@ export default function ProgressView({ taskId, onComplete, onError }: ProgressVi
 
     ws.onmessage = (event) => {
       try {
-        const data: ProgressUpdate = JSON.parse(event.data)
+        // The server batches frames that arrive close together into one array
+        const text = typeof event.data === 'string' ? event.data : decoder.decode(event.data)
+        const frames: ProgressUpdate[] = JSON.parse(text)
 
-        if (data.type === 'progress' || data.type === 'status') {
-          setProgress(data.progress || 0)
-          setStage(data.stage || 'unknown')
-          setMessage(data.message || 'Processing...')
-          addLog(`${STAGE_LABELS[data.stage] || data.stage}: ${Math.round(data.progress || 0)}%`)
-        } else if (data.type === 'final') {
-          setProgress(100)
-          setStage('completed')
-          setMessage('Your pitch deck has been successfully generated!')
-          addLog('Pipeline complete!')
-          setTimeout(onComplete, 1500)
-        } else if (data.type === 'error') {
-          onError(data.message || 'An error occurred')
+        for (const data of frames) {
+          if (data.type === 'progress' || data.type === 'status') {
+            setProgress(data.progress || 0)
+            setStage(data.stage || 'unknown')
+            setMessage(data.message || 'Processing...')
+            addLog(`${STAGE_LABELS[data.stage] || data.stage}: ${Math.round(data.progress || 0)}%`)
+          } else if (data.type === 'final') {
+            setProgress(100)
+            setStage('completed')
+            setMessage('Your pitch deck has been successfully generated!')
+            addLog('Pipeline complete!')
+            setTimeout(onComplete, 1500)
+          } else if (data.type === 'error') {
+            onError(data.message || 'An error occurred')
+          }
         }
       } catch (error) {
         console.error('Failed to parse WebSocket message:', error)
@@ -13,9 +13,9 @@
 # limitations under the License.
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
-import google.auth
 from pydantic import BaseModel, Field, model_validator
 
 # To use AI Studio credentials:
@@ -23,6 +23,8 @@ from pydantic import BaseModel, Field, model_validator
 #    GOOGLE_GENAI_USE_VERTEXAI=FALSE
 #    GOOGLE_API_KEY=PASTE_YOUR_ACTUAL_API_KEY_HERE
 # 2. This will override the default Vertex AI configuration
+# Credential discovery is slow, so import google.auth only when enabling this:
+# import google.auth
 # _, project_id = google.auth.default()
 # if project_id:
 #     os.environ.setdefault("GOOGLE_CLOUD_PROJECT", project_id)
@@ -44,6 +46,50 @@ class ResearchConfiguration(BaseModel):
     max_search_iterations: int = 5
 
 
+@lru_cache(maxsize=1)
+def _read_prompts(prompts_path: str) -> tuple[str, dict[str, str]]:
+    """Read the prompt files once per resolved prompts directory.
+
+    Args:
+        prompts_path (str): Absolute path of the prompts directory.
+
+    Returns:
+        tuple[str, dict[str, str]]: The persona prompt and the extra prompts
+            keyed by filename.
+    """
+    prompts_dir = Path(prompts_path)
+
+    if not prompts_dir.exists():
+        raise ValueError(f"Prompts directory not found: {prompts_dir}")
+
+    if not prompts_dir.is_dir():
+        raise ValueError(f"Prompts path is not a directory: {prompts_dir}")
+
+    # Well-known prompt files
+    well_known = {"persona.md"}
+
+    # Load well-known prompts
+    persona_path = prompts_dir / "persona.md"
+    if not persona_path.exists():
+        raise ValueError(f"Required prompt file not found: {persona_path}")
+
+    persona = persona_path.read_text(encoding="utf-8")
+
+    # Load extras (all other .md files)
+    extras = {}
+    with os.scandir(prompts_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.endswith(".md")
+                and entry.name not in well_known
+                and entry.is_file()
+            ):
+                with open(entry.path, "rb") as md_file:
+                    extras[entry.name] = md_file.read().decode("utf-8")
+
+    return persona, extras
+
+
 class PromptsConfiguration(BaseModel):
     """Configuration for prompt templates loaded from files.
 
@@ -62,31 +108,9 @@ class PromptsConfiguration(BaseModel):
         """Load prompt files from the prompts directory."""
         # Get prompts path from environment or use default
         prompts_path = os.environ.get("LUNA_PROMPTS_PATH", "./prompts/luna")
-        prompts_dir = Path(prompts_path)
-
-        if not prompts_dir.exists():
-            raise ValueError(f"Prompts directory not found: {prompts_dir}")
-
-        if not prompts_dir.is_dir():
-            raise ValueError(f"Prompts path is not a directory: {prompts_dir}")
-
-        # Well-known prompt files
-        well_known = {"persona.md"}
-
-        # Load well-known prompts
-        persona_path = prompts_dir / "persona.md"
-        if not persona_path.exists():
-            raise ValueError(f"Required prompt file not found: {persona_path}")
-
-        data["persona"] = persona_path.read_text(encoding="utf-8")
-
-        # Load extras (all other .md files)
-        extras = {}
-        for md_file in prompts_dir.glob("*.md"):
-            if md_file.name not in well_known:
-                extras[md_file.name] = md_file.read_text(encoding="utf-8")
-
-        data["extras"] = extras
+        persona, extras = _read_prompts(str(Path(prompts_path).resolve()))
+        data["persona"] = persona
+        data["extras"] = dict(extras)
 
         return data
 